@@ -7,9 +7,21 @@ import bpy
 import bmesh
 import struct
 import os
+import sys
+import re
+import mmap
 from pathlib import Path
+from collections.abc import MutableMapping
 from mathutils import Vector, Matrix, Quaternion
 import xml.etree.ElementTree as ET
+import numpy as np
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from numba import njit  # Optional - not bundled with Blender
+except ImportError:
+    njit = None
 
 # ============================================
 # SECTION 1: USER CONFIGURATION (EDIT THESE PATHS)
@@ -18,11 +30,14 @@ import xml.etree.ElementTree as ET
 FMDL_PATH = r"F:\Game\! Extracted File From GAMES\Extract MGS V TPP\MGS V TPP FileMonolith.v0.4.0 and Archive Unpacker\Assets\tpp\chara\ddg\Scenes\ddg0_main3_def.fmdl"
 TEXTURE_FOLDER = r"F:\Game\! Extracted File From GAMES\Extract MGS V TPP\MGS V TPP FileMonolith.v0.4.0 and Mass Texture ( just extract .ftex and .ftexs files to .dds)"
 DICTIONARY_FOLDER = r"C:\Users\Ali\Desktop\MGS Vtpp blender\444\dictionary"
-DLL_FOLDER = r"C:\Users\Ali\Desktop\MGS Vtpp blender\444\references"  # CityHash.dll و System.Half.dll
+DLL_FOLDER = r"C:\Users\Ali\Desktop\MGS Vtpp blender\444\references"  # CityHash.dll (half-floats are decoded with numpy, no System.Half.dll)
 
 # SETTINGS
 AABB_MODE = 'all'  # 'all' = all AABBs, 'important' = root bones only, 'none' = skip
 CREATE_AABBS = True  # Set to False to disable AABB creation
+VERBOSITY = 1  # 0 = errors/warnings/results only, 1 = + info, 2 = + debug
+DEBUG = VERBOSITY >= 2  # Dictionary samples / verbose load diagnostics
+INFO = VERBOSITY >= 1  # Per-record sample lines in the table readers
 
 # ============================================
 # SECTION 1: CONSTANTS - اصلاح شده بر اساس FMDL-Studio-v2
@@ -32,56 +47,75 @@ FMDL_MAGIC = b"FMDL"
 VERSION_GZ = 0x20140610  # 2.03
 VERSION_TPP = 0x20150211  # 2.04
 
-# ✅ اصلاح شده: Vertex Format Element Usage - بر اساس Fmdl.cs خطوط 85-101
-MESH_BUFFER_FORMAT_ELEMENT_USAGE = {
-    0: "POSITION",           # 0x00
-    1: "BONE_WEIGHT0",       # 0x01 - BLENDWEIGHT
-    2: "NORMAL",             # 0x02
-    3: "COLOR",              # 0x03 - COLOR0
-    4: "BONE_INDEX0",        # 0x04 - BLENDINDICES
-    5: "BONE_WEIGHT1",       # 0x05 - Additional weights
-    6: "BONE_INDEX1",        # 0x06 - Additional indices
-    7: "UV0",                # 0x07 - TEXCOORD0
-    8: "UV1",                # 0x08 - TEXCOORD1
-    9: "UV2",                # 0x09 - TEXCOORD2
-    10: "UV3",               # 0x0A - TEXCOORD3
-    11: "BONE_WEIGHT2",      # 0x0B
-    12: "BONE_INDEX2",       # 0x0C
-    13: "TANGENT",           # 0x0D
-    14: "BINORMAL",          # 0x0E
-}
-
-# ✅ اصلاح شده: Vertex Format Element Type - بر اساس Fmdl.cs
-MESH_BUFFER_FORMAT_ELEMENT_TYPE = {
-    0: "BYTE",               # 1 byte
-    1: "UBYTE",              # 1 byte unsigned
-    2: "SHORT",              # 2 bytes
-    3: "USHORT",             # 2 bytes unsigned
-    4: "FLOAT",              # 4 bytes
-    5: "HALF",               # 2 bytes (float16)
-    6: "R11G11B10",          # 4 bytes
-    7: "UNK_7",              # 4 bytes
-    8: "D3DCOLOR",           # 4 bytes (BGRA)
-    9: "UNK_9",              # 4 bytes
-    10: "INDEX16",           # 2 bytes
-    11: "INDEX32",           # 4 bytes
-}
-
-# ✅ اصلاح شده: Element Type Sizes (bytes)
-ELEMENT_TYPE_SIZES = {
-    0: 1,    # BYTE
-    1: 1,    # UBYTE
-    2: 2,    # SHORT
-    3: 2,    # USHORT
-    4: 4,    # FLOAT
-    5: 2,    # HALF
-    6: 4,    # R11G11B10
-    7: 4,    # UNK_7
-    8: 4,    # D3DCOLOR
-    9: 4,    # UNK_9
-    10: 2,   # INDEX16
-    11: 4,   # INDEX32
-}
+# ✅ اصلاح شده: Vertex Format Element Usage - بر اساس Fmdl.cs خطوط 85-101 (dense 0..14 -> tuple)
+MESH_BUFFER_FORMAT_ELEMENT_USAGE = (
+    "POSITION",              # 0 - 0x00
+    "BONE_WEIGHT0",          # 1 - 0x01 - BLENDWEIGHT
+    "NORMAL",                # 2 - 0x02
+    "COLOR",                 # 3 - 0x03 - COLOR0
+    "BONE_INDEX0",           # 4 - 0x04 - BLENDINDICES
+    "BONE_WEIGHT1",          # 5 - 0x05 - Additional weights
+    "BONE_INDEX1",           # 6 - 0x06 - Additional indices
+    "UV0",                   # 7 - 0x07 - TEXCOORD0
+    "UV1",                   # 8 - 0x08 - TEXCOORD1
+    "UV2",                   # 9 - 0x09 - TEXCOORD2
+    "UV3",                   # 10 - 0x0A - TEXCOORD3
+    "BONE_WEIGHT2",          # 11 - 0x0B
+    "BONE_INDEX2",           # 12 - 0x0C
+    "TANGENT",               # 13 - 0x0D
+    "BINORMAL",              # 14 - 0x0E
+)
+
+# Component count per usage (dense 0..14, any other usage reads as 1)
+USAGE_COMPONENT_COUNTS = (
+    3,                       # 0 - POSITION
+    4,                       # 1 - BONE_WEIGHT0
+    4,                       # 2 - NORMAL
+    4,                       # 3 - COLOR
+    4,                       # 4 - BONE_INDEX0
+    4,                       # 5 - BONE_WEIGHT1
+    4,                       # 6 - BONE_INDEX1
+    2,                       # 7 - UV0
+    2,                       # 8 - UV1
+    2,                       # 9 - UV2
+    2,                       # 10 - UV3
+    4,                       # 11 - BONE_WEIGHT2
+    4,                       # 12 - BONE_INDEX2
+    4,                       # 13 - TANGENT
+    4,                       # 14 - BINORMAL
+)
+
+# ✅ اصلاح شده: Vertex Format Element Type - بر اساس Fmdl.cs (dense 0..11)
+MESH_BUFFER_FORMAT_ELEMENT_TYPE = (
+    "BYTE",                  # 0 - 1 byte
+    "UBYTE",                 # 1 - 1 byte unsigned
+    "SHORT",                 # 2 - 2 bytes
+    "USHORT",                # 3 - 2 bytes unsigned
+    "FLOAT",                 # 4 - 4 bytes
+    "HALF",                  # 5 - 2 bytes (float16)
+    "R11G11B10",             # 6 - 4 bytes
+    "UNK_7",                 # 7 - 4 bytes
+    "D3DCOLOR",              # 8 - 4 bytes (BGRA)
+    "UNK_9",                 # 9 - 4 bytes
+    "INDEX16",               # 10 - 2 bytes
+    "INDEX32",               # 11 - 4 bytes
+)
+
+# ✅ اصلاح شده: Element Type Sizes (bytes, dense 0..11)
+ELEMENT_TYPE_SIZES = (
+    1,                       # 0 - BYTE
+    1,                       # 1 - UBYTE
+    2,                       # 2 - SHORT
+    2,                       # 3 - USHORT
+    4,                       # 4 - FLOAT
+    2,                       # 5 - HALF
+    4,                       # 6 - R11G11B10
+    4,                       # 7 - UNK_7
+    4,                       # 8 - D3DCOLOR
+    4,                       # 9 - UNK_9
+    2,                       # 10 - INDEX16
+    4,                       # 11 - INDEX32
+)
 
 # ✅ اصلاح شده: Feature Type Names - بر اساس Fmdl.cs Section0BlockType
 FEATURE_TYPE_NAMES = {
@@ -116,6 +150,17 @@ BUFFER_TYPE_NAMES = {
     3: "STRINGS",                     # Section1BlockType.Strings
 }
 
+# Precompiled little-endian readers: fn(buffer, offset) -> tuple
+_U32 = struct.Struct('<I').unpack_from
+_U64 = struct.Struct('<Q').unpack_from
+_VEC3F = struct.Struct('<3f').unpack_from
+_VEC4F = struct.Struct('<4f').unpack_from
+_VEC4B = struct.Struct('<4B').unpack_from
+_VEC4Q = struct.Struct('<4Q').unpack_from
+# IEEE half floats ('e') - converted in C by struct, no per-value Python bit math
+_VEC2E = struct.Struct('<2e').unpack_from
+_VEC4E = struct.Struct('<4e').unpack_from
+
 # Texture suffixes برای Fox Engine
 TEXTURE_SUFFIXES = {
     'Base_Tex_SRGB': '_bsm',
@@ -136,6 +181,8 @@ TEXTURE_SUFFIXES = {
 class DebugLogger:
     """Beautiful structured logging for FMDL import process"""
     
+    __slots__ = ('prefix', 'sub_prefix')
+    
     def __init__(self):
         self.prefix = "=" * 50
         self.sub_prefix = "-" * 30
@@ -183,21 +230,205 @@ class DebugLogger:
     def debug(self, message):
         print(f"[DEBUG] {message}")
 
+# --- 2.10: Strip Disabled Levels ---
+def _noop(*args, **kwargs):
+    pass
+
+# Disabled levels are bound to a no-op once at import time, so call sites keep
+# the logger.debug(...) syntax but skip message output entirely
+if VERBOSITY < 2:
+    DebugLogger.debug = staticmethod(_noop)
+if VERBOSITY < 1:
+    DebugLogger.info = staticmethod(_noop)
+
 logger = DebugLogger()
 
 # ============================================
 # SECTION 3: DICTIONARY MANAGER
 # ============================================
 
+# Precompiled dictionary line patterns - whole file is parsed by the C regex engine.
+# Alternatives are tried in order, so "name    -    hash" wins over "name hash".
+_FMDL_DICT_LINE_RE = re.compile(
+    r'^[ \t]*(?:([^\s#][^\n]*?)[ \t]+-[ \t]+([0-9A-Fa-f]+)'
+    r'|([^\s#][^\n]*?)[ \t]+([0-9A-Fa-f]+))[ \t\r]*$', re.M)
+_QAR_DICT_LINE_RE = re.compile(
+    r'^[ \t]*(?:([^\s#][^\n]*?)[ \t]+-[ \t]+([0-9A-Fa-f]+)'
+    r'|([^\s#][^\n]*?)[ \t]+([0-9A-Fa-f]{8,16})'
+    r'|([0-9A-Fa-f]{8,16})[ \t]+([^\s#][^\n]*?))[ \t\r]*$', re.M)
+DICT_READ_BUFFER = 1024 * 1024  # 1 MB - whole dictionary in a few read syscalls
+
+# Parsed dictionaries for this Blender session: (path, mtime) -> parsed data
+# Kept in driver_namespace - Run Script re-executes this file in a fresh namespace
+_DICT_CACHE = bpy.app.driver_namespace.setdefault('fmdl_dict_cache', {})
+# Any non-blank, non-comment line (used to count malformed lines in bulk)
+_DICT_CONTENT_LINE_RE = re.compile(r'^[ \t]*[^\s#]', re.M)
+
+# --- CityHash64 (v1.1) - used for PathCode64 texture lookups ---
+_K0 = 0xC3A5C85C97CB3127
+_K1 = 0xB492B66FBE98F273
+_K2 = 0x9AE16A3B2F90404F
+_KMUL = 0x9DDFEA08EB382D69
+_M64 = 0xFFFFFFFFFFFFFFFF
+
+def _rot64(v, shift):
+    return ((v >> shift) | (v << (64 - shift))) & _M64
+
+def _shift_mix(v):
+    return v ^ (v >> 47)
+
+def _bswap64(v):
+    return int.from_bytes(v.to_bytes(8, 'little'), 'big')
+
+def _hash_len16(u, v, mul=_KMUL):
+    a = ((u ^ v) * mul) & _M64
+    a ^= a >> 47
+    b = ((v ^ a) * mul) & _M64
+    b ^= b >> 47
+    return (b * mul) & _M64
+
+def _weak_hash_len32(s, i, a, b):
+    w, x, y, z = _VEC4Q(s, i)
+    a = (a + w) & _M64
+    b = _rot64((b + a + z) & _M64, 21)
+    c = a
+    a = (a + x + y) & _M64
+    b = (b + _rot64(a, 44)) & _M64
+    return (a + z) & _M64, (b + c) & _M64
+
+def _city_hash64(data):
+    """Pure-Python CityHash64, used when no compiled cityhash module is installed"""
+    s = data.encode('utf-8') if isinstance(data, str) else bytes(data)
+    n = len(s)
+    q = lambda i: _U64(s, i)[0]
+    
+    if n <= 16:
+        if n >= 8:
+            mul = _K2 + n * 2
+            a = (q(0) + _K2) & _M64
+            b = q(n - 8)
+            c = (_rot64(b, 37) * mul + a) & _M64
+            d = ((_rot64(a, 25) + b) * mul) & _M64
+            return _hash_len16(c, d, mul)
+        if n >= 4:
+            mul = _K2 + n * 2
+            a = _U32(s, 0)[0]
+            return _hash_len16(n + (a << 3), _U32(s, n - 4)[0], mul)
+        if n > 0:
+            y = (s[0] + (s[n >> 1] << 8)) & 0xFFFFFFFF
+            z = (n + (s[n - 1] << 2)) & 0xFFFFFFFF
+            return (_shift_mix(((y * _K2) ^ (z * _K0)) & _M64) * _K2) & _M64
+        return _K2
+    
+    if n <= 32:
+        mul = _K2 + n * 2
+        a = (q(0) * _K1) & _M64
+        b = q(8)
+        c = (q(n - 8) * mul) & _M64
+        d = (q(n - 16) * _K2) & _M64
+        return _hash_len16((_rot64((a + b) & _M64, 43) + _rot64(c, 30) + d) & _M64,
+                           (a + _rot64((b + _K2) & _M64, 18) + c) & _M64, mul)
+    
+    if n <= 64:
+        mul = _K2 + n * 2
+        a = (q(0) * _K2) & _M64
+        b = q(8)
+        c = q(n - 24)
+        d = q(n - 32)
+        e = (q(16) * _K2) & _M64
+        f = (q(24) * 9) & _M64
+        g = q(n - 8)
+        h = (q(n - 16) * mul) & _M64
+        u = (_rot64((a + g) & _M64, 43) + (_rot64(b, 30) + c) * 9) & _M64
+        v = (((a + g) & _M64 ^ d) + f + 1) & _M64
+        w = (_bswap64(((u + v) * mul) & _M64) + h) & _M64
+        x = (_rot64((e + f) & _M64, 42) + c) & _M64
+        y = ((_bswap64(((v + w) * mul) & _M64) + g) * mul) & _M64
+        z = (e + f + c) & _M64
+        a = (_bswap64(((x + z) * mul + y) & _M64) + b) & _M64
+        b = (_shift_mix(((z + a) * mul + d + h) & _M64) * mul) & _M64
+        return (b + x) & _M64
+    
+    # > 64 bytes: 64-byte chunks with 56 bytes of state (v, w, x, y, z)
+    x = q(n - 40)
+    y = (q(n - 16) + q(n - 56)) & _M64
+    z = _hash_len16((q(n - 48) + n) & _M64, q(n - 24))
+    v = _weak_hash_len32(s, n - 64, n, z)
+    w = _weak_hash_len32(s, n - 32, (y + _K1) & _M64, x)
+    x = (x * _K1 + q(0)) & _M64
+    
+    for i in range(0, (n - 1) & ~63, 64):
+        x = (_rot64((x + y + v[0] + q(i + 8)) & _M64, 37) * _K1) & _M64
+        y = (_rot64((y + v[1] + q(i + 48)) & _M64, 42) * _K1) & _M64
+        x ^= w[1]
+        y = (y + v[0] + q(i + 40)) & _M64
+        z = (_rot64((z + w[0]) & _M64, 33) * _K1) & _M64
+        v = _weak_hash_len32(s, i, (v[1] * _K1) & _M64, (x + w[0]) & _M64)
+        w = _weak_hash_len32(s, i + 32, (z + w[1]) & _M64, (y + q(i + 16)) & _M64)
+        z, x = x, z
+    
+    return _hash_len16((_hash_len16(v[0], w[0]) + _shift_mix(y) * _K1 + z) & _M64,
+                       (_hash_len16(v[1], w[1]) + x) & _M64)
+
+# Prefer a compiled CityHash64 (C extension, no per-call marshaling), else pure Python
+try:
+    from cityhash import CityHash64  # pip install cityhash
+except ImportError:
+    try:
+        from CityHash import CityHash64
+    except ImportError:
+        CityHash64 = _city_hash64
+
+# --- Batch hash lookup (fused binary search + equality) ---
+def _batch_lookup_kernel(sorted_keys, query_keys, out_idx):
+    n = sorted_keys.size
+    for i in range(query_keys.size):
+        q = query_keys[i]
+        lo = 0
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if sorted_keys[mid] < q:
+                lo = mid + 1
+            else:
+                hi = mid
+        out_idx[i] = lo if lo < n and sorted_keys[lo] == q else -1
+
+_batch_lookup_nb = None
+if njit is not None:
+    try:
+        _batch_lookup_nb = njit(cache=True)(_batch_lookup_kernel)
+    except Exception:
+        # No cache locator (e.g. script run from Blender's text editor)
+        _batch_lookup_nb = njit(_batch_lookup_kernel)
+
+def _batch_lookup_indices(sorted_keys, query_keys):
+    """Index of every query hash in sorted_keys, -1 where missing"""
+    out_idx = np.empty(query_keys.shape, dtype=np.int64)
+    if _batch_lookup_nb is not None:
+        _batch_lookup_nb(sorted_keys, query_keys.ravel(), out_idx.ravel())
+        return out_idx
+    
+    # NumPy fallback: searchsorted + equality pass
+    if not len(sorted_keys):
+        out_idx.fill(-1)
+        return out_idx
+    idx = np.minimum(np.searchsorted(sorted_keys, query_keys), len(sorted_keys) - 1)
+    out_idx[...] = np.where(sorted_keys[idx] == query_keys, idx, -1)
+    return out_idx
+
 class DictionaryManager:
     """Manages FMDL bone names and QAR texture path dictionaries"""
     
+    __slots__ = ('fmdl_dict', 'qar_keys', 'qar_vals', 'folder', 'fmdl_dict_rev',
+                 'fmdl_keys_sorted', 'fmdl_names_sorted',
+                 '_bone_name_cached', '_texture_path_cached')
+    
     def __init__(self, dict_folder):
         self.fmdl_dict = {}  # hash -> bone name
-        self.qar_dict = {}   # hash -> texture path
+        self.qar_keys = np.empty(0, dtype=np.uint64)  # sorted texture path hashes
+        self.qar_vals = []                            # texture paths, aligned with qar_keys
         self.folder = Path(dict_folder)
-        self.warning_count = 0
-        self.max_warnings = 5
         
         logger.section("DICTIONARY MANAGER")
         logger.start("Initializing dictionaries")
@@ -205,8 +436,23 @@ class DictionaryManager:
         self.load_fmdl_dict()
         self.load_qar_dict()
         
+        # name -> hash reverse index (built once; first hash wins on duplicate names)
+        self.fmdl_dict_rev = {name: h for h, name in reversed(self.fmdl_dict.items())}
+        self._build_sorted_arrays()
+        
+        # Memoized lookups - the same hashes repeat across bones, groups and materials
+        self._bone_name_cached = lru_cache(maxsize=4096)(self._lookup_bone_name)
+        self._texture_path_cached = lru_cache(maxsize=4096)(self._lookup_texture_path)
+        
         logger.success("Dictionary loading", 
-                      f"FMDL: {len(self.fmdl_dict)}, QAR: {len(self.qar_dict)}")
+                      f"FMDL: {len(self.fmdl_dict)}, QAR: {len(self.qar_keys)}")
+    
+    # --- 3.0: Read Dictionary Text ---
+    @staticmethod
+    def _read_text(path):
+        """Binary read with a large buffer, decoded once (CRLF handled by the patterns)"""
+        with open(path, 'rb', buffering=DICT_READ_BUFFER) as f:
+            return f.read().decode('utf-8')
     
     # --- 3.1: Load FMDL Bone Dictionary ---
     def load_fmdl_dict(self):
@@ -217,53 +463,32 @@ class DictionaryManager:
             logger.error("FMDL dictionary", f"File not found: {fmdl_path}")
             return
         
+        cache_key = (str(fmdl_path), fmdl_path.stat().st_mtime)
+        if cache_key in _DICT_CACHE:
+            self.fmdl_dict = _DICT_CACHE[cache_key]
+            logger.success("FMDL dictionary", f"{len(self.fmdl_dict)} entries (cached)")
+            return
+        
         try:
-            with open(fmdl_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                line_count = 0
-                
-                # Show first 5, ... , last 3 lines for debug
-                logger.debug(f"First 5 lines:")
-                for i, line in enumerate(lines[:5]):
-                    logger.debug(f"  {i+1}: {line.strip()[:60]}")
-                if len(lines) > 8:
-                    logger.debug("  ...")
-                    for i, line in enumerate(lines[-3:], len(lines)-2):
-                        logger.debug(f"  {i}: {line.strip()[:60]}")
-                
-                for line_num, line in enumerate(lines, 1):
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Format 1: "name    -    hash"
-                    parts = line.split('    -    ')
-                    if len(parts) == 2:
-                        name = parts[0].strip()
-                        hash_str = parts[1].strip()
-                    else:
-                        # Format 2: name[spaces]hash
-                        parts = line.rsplit(maxsplit=1)
-                        if len(parts) == 2:
-                            name, hash_str = parts
-                            name = name.strip()
-                            hash_str = hash_str.strip()
-                        else:
-                            self._log_limited_warning(f"Line {line_num}: Invalid format: {line[:50]}...")
-                            continue
-                    
-                    try:
-                        hash_val = int(hash_str, 16)
-                        self.fmdl_dict[hash_val] = name
-                        line_count += 1
-                    except ValueError:
-                        self._log_limited_warning(f"Line {line_num}: Invalid hash: {hash_str}")
-                
-                logger.success("FMDL dictionary", f"{line_count} entries loaded")
-                if line_count > 0:
-                    sample_name = list(self.fmdl_dict.values())[0]
-                    sample_hash = next(h for h, n in self.fmdl_dict.items() if n == sample_name)
-                    logger.debug(f"Sample: {sample_name} = {sample_hash:016X}")
+            text = self._read_text(fmdl_path)
+            
+            # Whole file is tokenized in one findall - no per-line Python loop
+            # Format 1: "name    -    hash" / Format 2: name[spaces]hash
+            matches = _FMDL_DICT_LINE_RE.findall(text)
+            for name1, hash1, name2, hash2 in matches:
+                self.fmdl_dict[int(hash1 or hash2, 16)] = sys.intern((name1 or name2).strip())
+            
+            bad_lines = len(_DICT_CONTENT_LINE_RE.findall(text)) - len(matches)
+            if bad_lines:
+                logger.warning(f"FMDL dictionary: {bad_lines} malformed lines skipped")
+            
+            _DICT_CACHE[cache_key] = self.fmdl_dict
+            
+            line_count = len(self.fmdl_dict)
+            logger.success("FMDL dictionary", f"{line_count} entries loaded")
+            if DEBUG and line_count > 0:
+                sample_hash, sample_name = next(iter(self.fmdl_dict.items()))
+                logger.debug(f"Sample: {sample_name} = {sample_hash:016X}")
                     
         except Exception as e:
             logger.error("FMDL dictionary", str(e))
@@ -274,107 +499,296 @@ class DictionaryManager:
         qar_path = self.folder / "qar_dictionary.txt"
         
         if not qar_path.exists():
-            logger.warning("QAR dictionary", f"File not found: {qar_path} - will use hash-based texture lookup later")
+            logger.warning(f"QAR dictionary: File not found: {qar_path} - will use hash-based texture lookup later")
+            return
+        
+        cache_key = (str(qar_path), qar_path.stat().st_mtime)
+        if cache_key in _DICT_CACHE:
+            self.qar_keys, self.qar_vals = _DICT_CACHE[cache_key]
+            logger.success("QAR dictionary", f"{len(self.qar_keys)} entries (cached)")
             return
         
         try:
-            with open(qar_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                line_count = 0
-                
-                # Show first 5, ... , last 3 lines for debug
-                logger.debug(f"First 5 lines:")
-                for i, line in enumerate(lines[:5]):
-                    logger.debug(f"  {i+1}: {line.strip()[:60]}")
-                if len(lines) > 8:
-                    logger.debug("  ...")
-                    for i, line in enumerate(lines[-3:], len(lines)-2):
-                        logger.debug(f"  {i}: {line.strip()[:60]}")
-                
-                for line_num, line in enumerate(lines, 1):
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Format 1: "path    -    hash"
-                    parts = line.split('    -    ')
-                    if len(parts) == 2:
-                        filepath = parts[0].strip()
-                        hash_str = parts[1].strip()
-                    else:
-                        # Format 2: hash path or path[spaces]hash
-                        parts = line.rsplit(maxsplit=1)
-                        if len(parts) == 2:
-                            first, second = parts
-                            first = first.strip()
-                            second = second.strip()
-                            # Try both orders
-                            try:
-                                hash_val = int(first, 16)
-                                filepath = second
-                            except ValueError:
-                                try:
-                                    hash_val = int(second, 16)
-                                    filepath = first
-                                except ValueError:
-                                    self._log_limited_warning(f"Line {line_num}: No valid hash found: {line[:50]}...")
-                                    continue
-                        else:
-                            self._log_limited_warning(f"Line {line_num}: Invalid format: {line[:50]}...")
-                            continue
-                    
-                    try:
-                        hash_val = int(hash_str if 'hash_str' in locals() else first, 16)
-                        self.qar_dict[hash_val] = filepath
-                        line_count += 1
-                    except ValueError:
-                        self._log_limited_warning(f"Line {line_num}: Invalid hash: {hash_str}")
-                
-                logger.success("QAR dictionary", f"{line_count} entries loaded")
-                if line_count > 0:
-                    sample_path = list(self.qar_dict.values())[0]
-                    sample_hash = next(h for h, p in self.qar_dict.items() if p == sample_path)
-                    logger.debug(f"Sample: {sample_path[:50]}... = {sample_hash:016X}")
+            text = self._read_text(qar_path)
+            
+            # Format 1: "path    -    hash" / Format 2: path[spaces]hash / Format 3: hash[spaces]path
+            matches = _QAR_DICT_LINE_RE.findall(text)
+            entries = {}  # temporary, last entry for a hash wins
+            for path1, hash1, path2, hash2, hash3, path3 in matches:
+                entries[int(hash1 or hash2 or hash3, 16)] = sys.intern((path1 or path2 or path3).strip())
+            
+            # Keep one packed uint64 key array + path list instead of a dict of int objects
+            keys = np.fromiter(entries.keys(), dtype=np.uint64, count=len(entries))
+            order = np.argsort(keys)
+            paths = list(entries.values())
+            self.qar_keys = keys[order]
+            self.qar_vals = [paths[i] for i in order.tolist()]
+            _DICT_CACHE[cache_key] = (self.qar_keys, self.qar_vals)
+            
+            bad_lines = len(_DICT_CONTENT_LINE_RE.findall(text)) - len(matches)
+            if bad_lines:
+                logger.warning(f"QAR dictionary: {bad_lines} malformed lines skipped")
+            
+            line_count = len(self.qar_keys)
+            logger.success("QAR dictionary", f"{line_count} entries loaded")
+            if DEBUG and line_count > 0:
+                sample_hash, sample_path = int(self.qar_keys[0]), self.qar_vals[0]
+                logger.debug(f"Sample: {sample_path[:50]}... = {sample_hash:016X}")
                     
         except Exception as e:
             logger.error("QAR dictionary", str(e))
     
-    # --- 3.6: Limited Warning Logger ---
-    def _log_limited_warning(self, message):
-        """Limit warnings to 5 + 3 last ones"""
-        if self.warning_count < self.max_warnings:
-            logger.warning(message)
-            self.warning_count += 1
-        elif self.warning_count == self.max_warnings:
-            logger.warning("... (more warnings suppressed)")
-            self.warning_count += 1
+    # --- 3.6: Build Sorted Hash Arrays ---
+    def _build_sorted_arrays(self):
+        """Sorted uint64 hash / name arrays for vectorized bulk lookup"""
+        keys = np.fromiter(self.fmdl_dict.keys(), dtype=np.uint64, count=len(self.fmdl_dict))
+        order = np.argsort(keys)
+        self.fmdl_keys_sorted = keys[order]
+        self.fmdl_names_sorted = np.array(list(self.fmdl_dict.values()), dtype=object)[order]
     
     # --- 3.3: Get Bone Name by Hash ---
     def get_bone_name(self, hash_val):
         """Returns bone name from hash, fallback to hex format"""
+        return self._bone_name_cached(hash_val)
+    
+    def _lookup_bone_name(self, hash_val):
         return self.fmdl_dict.get(hash_val, f"Bone_{hash_val:016X}")
     
+    # --- 3.3.1: Get Bone Names by Hash (bulk) ---
+    def get_bone_names_bulk(self, hashes):
+        """Resolve many hashes in one batch lookup, same fallback as get_bone_name"""
+        hashes = np.ascontiguousarray(hashes, dtype=np.uint64)
+        names = np.empty(hashes.shape, dtype=object)
+        
+        idx = _batch_lookup_indices(self.fmdl_keys_sorted, hashes)
+        hits = idx >= 0
+        names[hits] = self.fmdl_names_sorted[idx[hits]]
+        
+        misses = ~hits
+        names[misses] = [f"Bone_{h:016X}" for h in hashes[misses].tolist()]
+        return names.tolist()
+    
     # --- 3.4: Get Texture Path by Hash ---
     def get_texture_path(self, hash_val):
         """Returns texture filepath from hash or None"""
-        return self.qar_dict.get(hash_val, None)
+        return self._texture_path_cached(hash_val)
+    
+    def _lookup_texture_path(self, hash_val):
+        keys = self.qar_keys
+        key = np.uint64(hash_val)
+        idx = int(np.searchsorted(keys, key))
+        if idx < len(keys) and keys[idx] == key:
+            return self.qar_vals[idx]
+        return None
+    
+    # --- 3.4.1: All Texture Paths ---
+    def qar_items(self):
+        """(hash, path) pairs of the QAR dictionary, ordered by hash"""
+        return zip(self.qar_keys.tolist(), self.qar_vals)
     
     # --- 3.5: Reverse Lookup Hash by Name ---
     def lookup_name_hash(self, name):
         """Find hash by bone name (reverse lookup)"""
-        for hash_val, bone_name in self.fmdl_dict.items():
-            if bone_name == name:
-                return hash_val
-        return None
+        return self.fmdl_dict_rev.get(name)
+
+
+
+
+
+
+
+
+
+
+# --- Column-oriented record tables (SoA) ---
+class RecordTable:
+    """Per-field numpy columns with dict-like row views (bones/meshes/names/paths/aabbs)"""
+    
+    __slots__ = ('columns', 'fields', 'derived', 'length')
+    
+    def __init__(self, columns=None, derived=None, fields=None):
+        self.columns = dict(columns or {})
+        self.derived = dict(derived or {})  # field -> fn(table, row index)
+        self.fields = tuple(fields or (*self.columns, *self.derived))
+        self.length = len(next(iter(self.columns.values()))) if self.columns else 0
+    
+    def __len__(self):
+        return self.length
+    
+    def __iter__(self):
+        return (RecordRow(self, i) for i in range(self.length))
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [RecordRow(self, j) for j in range(*i.indices(self.length))]
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError(f"record index {i} out of range")
+        return RecordRow(self, i)
+    
+    def column(self, name):
+        """Raw numpy column (None if missing)"""
+        return self.columns.get(name)
+    
+    def value(self, i, key):
+        if key in self.columns:
+            col = self.columns[key]
+            if col.ndim > 1:
+                return tuple(col[i].tolist())
+            return col[i] if col.dtype == object else col[i].item()
+        return self.derived[key](self, i)
+    
+    def set_value(self, i, key, value):
+        if key not in self.columns:
+            # Late-bound fields (aabb, local_matrix, ...) live in object columns
+            self.columns[key] = np.full(self.length, None, dtype=object)
+            if key not in self.fields:
+                self.fields += (key,)
+        self.columns[key][i] = value
+    
+    def clear(self):
+        self.columns = {k: v[:0] for k, v in self.columns.items()}
+        self.length = 0
+
+class RecordRow(MutableMapping):
+    """Dict-like view of one RecordTable row"""
+    
+    __slots__ = ('table', 'i')
+    
+    def __init__(self, table, i):
+        self.table = table
+        self.i = i
+    
+    def __getitem__(self, key):
+        if key not in self.table.columns and key not in self.table.derived:
+            raise KeyError(key)
+        return self.table.value(self.i, key)
+    
+    def __setitem__(self, key, value):
+        self.table.set_value(self.i, key, value)
+    
+    def __delitem__(self, key):
+        raise TypeError("RecordTable rows have a fixed field set")
+    
+    def __iter__(self):
+        return iter(self.table.fields)
+    
+    def __len__(self):
+        return len(self.table.fields)
+    
+    def __repr__(self):
+        return repr(dict(self))
+
+def _row_index(table, i):
+    return i
 
+def _aabb_center(table, i):
+    hi = table.columns['max'][i, :3].astype(np.float64)
+    lo = table.columns['min'][i, :3].astype(np.float64)
+    return tuple(((lo + hi) / 2).tolist())
 
+def _aabb_size(table, i):
+    hi = table.columns['max'][i, :3].astype(np.float64)
+    lo = table.columns['min'][i, :3].astype(np.float64)
+    return tuple((hi - lo).tolist())
 
+def _parent_bone_name(table, i):
+    parent = table.columns['parent_index'][i]
+    return f"Bone_{parent}" if parent >= 0 else "ROOT"
 
+def _record_dtype(fields, itemsize):
+    """Structured dtype from (name, format, offset) fields - unnamed gaps are padding"""
+    names, formats, offsets = zip(*fields)
+    return np.dtype({'names': list(names), 'formats': list(formats), 'offsets': list(offsets),
+                     'itemsize': itemsize})
+
+class SlotRecord(MutableMapping):
+    """Fixed-field record with __slots__ - attribute access plus the dict protocol callers use"""
+    
+    __slots__ = ()
+    _derived = ()  # read-only display fields, computed by properties on access
+    _fields = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls.__slots__ + cls._derived
+    
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            setattr(self, key, value)
+    
+    def __getitem__(self, key):
+        if key not in self._fields:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __delitem__(self, key):
+        raise TypeError(f"{type(self).__name__} has a fixed field set")
+    
+    def __iter__(self):
+        return iter(self._fields)
+    
+    def __len__(self):
+        return len(self._fields)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
 
+class MaterialRecord(SlotRecord):
+    __slots__ = ('index', 'name_index', 'name', 'shader_name', 'material_type_index', 'texture_count',
+                 'parameter_count', 'texture_assignments', 'parameter_assignments', 'preset')
 
+class TextureRefRecord(SlotRecord):
+    __slots__ = ('index', 'name_index', 'path_index', 'name', 'path', 'role')
+    _derived = ('full_path',)
+    
+    @property
+    def full_path(self):
+        return f"{self.path}{self.name}" if self.path else self.name
 
+class DataLayoutRecord(SlotRecord):
+    __slots__ = ('index', 'buffer_count', 'format_element_count', 'unknown0', 'uv_count',
+                 'buffer_headers_start', 'format_elements_start', 'expected_stride',
+                 'buffer_valid', 'format_valid')
+    _derived = ('layout_name',)
+    
+    @property
+    def layout_name(self):
+        return f"Layout_{self.index:02d}_{self.buffer_count}b_{self.format_element_count}e_{self.uv_count}uv"
 
+class BufferHeaderRecord(SlotRecord):
+    __slots__ = ('index', 'file_buffer_index', 'vbuffer_info', 'format_element_count', 'stride',
+                 'bind_slot', 'data_offset', 'layout_match', 'stride_valid')
+    _derived = ('stride_hex', 'header_name')
+    
+    @property
+    def stride_hex(self):
+        return f"0x{self.stride:02X}"
+    
+    @property
+    def header_name(self):
+        return f"VStream_{self.index}_{self.stride}B_{self.format_element_count}attr"
 
+class FormatElementRecord(SlotRecord):
+    __slots__ = ('index', 'usage', 'usage_name', 'type', 'type_name', 'offset', 'byte_size',
+                 'components')
+    _derived = ('attr_name',)
+    
+    @property
+    def attr_name(self):
+        return f"{self.usage_name}_{self.type_name}_{self.offset}"
+
+class FileBufferHeaderRecord(SlotRecord):
+    __slots__ = ('index', 'type', 'type_name', 'data_size', 'data_offset', 'file_offset', 'valid')
 
 # ============================================
 # SECTION 4: FMDL PARSER
@@ -435,23 +849,48 @@ class FMDLParser:
         self.filepath = Path(filepath)
         self.dict = dict_manager
         self.data = None
+        self._mv = None  # flat unsigned-byte memoryview over self.data - zero-copy slices
         
         # Storage for all parsed data (MGSV TPP/GZ + PES compatible)
         self.header = {}
         self.feature_headers = []
+        self.feature_table = ((),) * 256  # type id -> feature headers
+        self._feature_by_name = {}  # upper-cased name -> first feature header
+        self._feature_name_lookup = {}  # queried pattern -> resolved header (or None)
+        self._total_indices = None  # index count over the index buffers (feature 14)
+        self._feature_header_cache = {}  # type id -> validated header (or None)
+        self._feature_base_offset = {}  # type id -> absolute data offset
+        self._param_roles = None  # texture role per material parameter (feature 7)
+        self._mat_name_cache = {}  # name index -> resolved material/shader name
+        self._tex_name_cache = {}  # name index -> resolved texture name
+        self._tex_path_cache = {}  # path index -> resolved texture path
+        self._preset_cache = {}  # shader name -> material preset
         self.buffer_headers = []
-        self.bones = []
+        self.bones = RecordTable()  # SoA: one numpy column per field
+        self.bone_parents = np.empty(0, dtype='<i4')  # hierarchy parent per bone (read_skeleton_hierarchy)
         self.materials = []
-        self.meshes = []
-        self.names = []
-        self.paths = []
+        self.meshes = RecordTable()
+        self.names = RecordTable()
+        self.paths = RecordTable()
+        self.name_hashes = np.empty(0, dtype='<u8')  # StrCode64 per name index
+        self.bone_aabb_index = np.empty(0, dtype=np.int32)  # per bone, -1 = no AABB
+        self.path_hashes = np.empty(0, dtype='<u8')  # PathCode64 per path index
         self.texture_refs = []
+        self.material_types = None  # feature 8, read on demand by read_materials
+        self.material_parameter_vectors = []
+        self.section1_blocks = {}
+        self.bone_groups = []
+        self.str_code64s = []  # TPP StrCode64 table (empty = use self.names)
+        self.path_code64s = []  # TPP PathCode64 table (empty = use self.paths)
         self.mesh_data_layouts = []
         self.mesh_buffer_headers = []
         self.mesh_buffer_format_elements = []
+        self._fmt_per_vbuf = {}  # vbuf index -> format element window
+        self._bone_name_scheme = None  # candidate layout that last matched in _find_bone_name
         self.file_mesh_buffer_headers = []
-        self.ibuffer_slices = []
-        self.aabbs = []
+        self.ibuffer_slices = RecordTable()  # SoA: start_index/count/triangles/valid/offset
+        self.aabbs = RecordTable()
+        self.aabb_raw = np.empty((0, 2, 4), dtype='<f4')  # (N, max/min, xyzw) view into the file
         
         logger.section("FMDL PARSER INITIALIZATION")
         logger.start(f"Reading: {self.filepath.name}")
@@ -460,8 +899,17 @@ class FMDLParser:
             raise FileNotFoundError(f"FMDL file not found: {filepath}")
         
         try:
+            # Map the file read-only so pages are loaded on demand and slices /
+            # struct.unpack_from work on the original bytes (no heap copy).
+            # Parsed columns and result['raw_data'] keep the mapping alive; GC unmaps it.
             with open(self.filepath, 'rb') as f:
-                self.data = f.read()
+                try:
+                    self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty or non file-backed input - fall back to buffered read
+                    f.seek(0)
+                    self.data = f.read()
+            self._mv = memoryview(self.data).cast('B')
             size_mb = len(self.data)/1024/1024
             logger.success("File loaded", f"{len(self.data):,} bytes ({size_mb:.2f} MB)")
         except Exception as e:
@@ -471,37 +919,35 @@ class FMDLParser:
     
     
     # 🔥 HELPER METHODS ← دقیقاً اینجا (بعد __init__, قبل public methods)
+    MATRIX_STRUCT = struct.Struct('<16f')  # 4x4 float matrix, 64 bytes
+    
     def _read_matrix4x4(self, offset):
-        """Read 4x4 float matrix (64 bytes)"""
-        matrix = []
-        for i in range(16):
-            val = struct.unpack('<f', self.data[offset + i*4:offset + (i*4)+4])[0]
-            matrix.append(val)
-        return ma
+        """Read 4x4 float matrix (64 bytes) as a flat list of 16 floats"""
+        return list(self.MATRIX_STRUCT.unpack_from(self._mv, offset))
 
 
-    def _read_string(self, offset):
-        """Read null-terminated string"""
-        end = self.data.find(b'\x00', offset)  # ✅ درست شد!
-        return self.data[offset:end].decode('utf-8', errors='ignore')
+    def _read_string(self, offset, max_len=None):
+        """Read null-terminated string (search capped at max_len bytes)"""
+        limit = len(self.data) if max_len is None else min(offset + max_len, len(self.data))
+        end = self.data.find(b'\x00', offset, limit)  # ✅ درست شد!
+        if end < 0:
+            end = limit
+        return str(self._mv[offset:end], 'utf-8', 'ignore')
 
 
     # 🔥 همه Helper ها با TypeError فیکس
-    def _get_feature_header(self, feature_id):
-        """Get feature by ID (original method)"""
-        for fh in self.feature_headers:
-            if fh.get('id') == feature_id:
-                return fh
-        return None
-
+    # (_get_feature_header by type lives in 4.4.2)
     def _get_feature_header_by_name(self, name_pattern):
         """Universal feature finder - FIXED"""
-        name_pattern = name_pattern.upper()
-        for fh in self.feature_headers:
-            fh_name = fh.get('name', b'').upper()
-            if name_pattern in fh_name:
-                return fh
-        return None
+        if name_pattern in self._feature_name_lookup:
+            return self._feature_name_lookup[name_pattern]
+        pattern = name_pattern.upper()
+        fh = self._feature_by_name.get(pattern)
+        if fh is None:
+            # Substring match over the distinct names only
+            fh = next((h for fh_name, h in self._feature_by_name.items() if pattern in fh_name), None)
+        self._feature_name_lookup[name_pattern] = fh
+        return fh
 
     def _get_feature_header_by_count(self, expected_count):
         """Find feature by matching count"""
@@ -512,17 +958,54 @@ class FMDLParser:
 
 
     def _get_format_for_vbuffer(self, vbuf_idx):
-        """Dynamic format matching"""
-        start_idx = vbuf_idx * 12 % len(self.mesh_buffer_format_elements)
-        return self.mesh_buffer_format_elements[start_idx:start_idx+12]
-
+        """Dynamic format matching (shared 12-element tuple per vbuffer)"""
+        fmt = self._fmt_per_vbuf.get(vbuf_idx)
+        if fmt is None:
+            elements = self.mesh_buffer_format_elements
+            if not elements:
+                return ()
+            start_idx = vbuf_idx * 12 % len(elements)
+            fmt = self._fmt_per_vbuf[vbuf_idx] = tuple(elements[start_idx:start_idx+12])
+        return fmt
+
+    def _read_records(self, dtype, offset, count):
+        """Fixed-size record table as a list of field tuples (one frombuffer + tolist)"""
+        return np.frombuffer(self.data, dtype=dtype, count=max(count, 0), offset=offset).tolist()
+    
+    HASH_DTYPE = np.dtype('<u8')  # StrCode64 / PathCode64
+    
+    def _read_feature_records(self, feature_type, dtype, label):
+        """Whole feature table as a structured array, count clamped to the file (None if missing)"""
+        fh = self._get_feature_header(feature_type)
+        if not fh:
+            logger.warning(f"No {self.get_feature_type_name(feature_type)} feature ({feature_type})")
+            return None
+        
+        offset = self._feature_base_offset[feature_type]
+        count = fh['total_count']
+        size = dtype.itemsize
+        
+        # Bounds check
+        if offset + count * size > len(self.data):
+            logger.warning(f"{label[:1].upper()}{label[1:]} truncated: {count} need {count*size} bytes")
+            count = max(len(self.data) - offset, 0) // size
+        
+        logger.start(f"Reading {count} {label} @ 0x{offset:08X}")
+        return np.frombuffer(self.data, dtype=dtype, count=count, offset=offset)
+    
+    BONE_NAME_MAX_LEN = 128
+    
     def _find_bone_name(self, offset, idx, count):
-        """Universal bone name finder"""
-        candidates = [offset + idx * 64, offset + idx * 32, offset + count * 8 + idx * 64]
-        for pos in candidates:
+        """Universal bone name finder (last matching layout is tried first)"""
+        candidates = (offset + idx * 64, offset + idx * 32, offset + count * 8 + idx * 64)
+        scheme = self._bone_name_scheme
+        order = (0, 1, 2) if scheme is None else (scheme,) + tuple(s for s in (0, 1, 2) if s != scheme)
+        for s in order:
+            pos = candidates[s]
             if pos + 64 < len(self.data):
-                name = self._read_string(pos)
+                name = self._read_string(pos, self.BONE_NAME_MAX_LEN)
                 if name and len(name.strip()) > 1:
+                    self._bone_name_scheme = s
                     return name
         return None
 
@@ -541,6 +1024,10 @@ class FMDLParser:
 
     
     # --- 4.1: Header Reading (TPP/GZ/PES Compatible) ---
+    # magic, version, file desc offset, feature flags, feature types, (4 pad), buffer types,
+    # (4 pad), feature count, buffer count, features data offset/size, buffers data offset/size
+    HEADER_STRUCT = struct.Struct('<4sIIII4xI4xIIIIII')
+    
     def read_header(self):
         """Parse FMDL main header - supports all Fox Engine versions"""
         logger.sub_section("FMDL Header (Multi-Version)")
@@ -549,13 +1036,16 @@ class FMDLParser:
         if len(self.data) < 0x38:
             raise ValueError(f"File too short ({len(self.data)} bytes) for FMDL header")
         
+        # Whole 0x38-byte header in one unpack
+        (magic, version, file_desc_offset, feature_flags, feature_types, buffer_types,
+         feature_count, buffer_count, features_data_offset, features_data_size,
+         buffers_data_offset, buffers_data_size) = self.HEADER_STRUCT.unpack_from(self.data, 0)
+        
         # Verify magic
-        magic = self.data[0:4]
         if magic != FMDL_MAGIC:
             raise ValueError(f"Invalid magic: {magic.hex()} (expected 'FMDL')")
         
         # Version as UINT32 (fixed: was float) - TPP=0x20150211, GZ=0x20140610
-        version = struct.unpack('<I', self.data[0x04:0x08])[0]
         
         # Determine engine version for compatibility
         if version == VERSION_TPP:
@@ -572,16 +1062,16 @@ class FMDLParser:
             'magic': magic.decode('ascii'),
             'version_raw': version,
             'version': f"0x{version:08X}",
-            'file_desc_offset': struct.unpack('<I', self.data[0x08:0x0C])[0],
-            'feature_flags': struct.unpack('<I', self.data[0x0C:0x10])[0],  # Added missing field
-            'feature_types': struct.unpack('<I', self.data[0x10:0x14])[0],
-            'buffer_types': struct.unpack('<I', self.data[0x18:0x1C])[0],
-            'feature_count': struct.unpack('<I', self.data[0x20:0x24])[0],
-            'buffer_count': struct.unpack('<I', self.data[0x24:0x28])[0],
-            'features_data_offset': struct.unpack('<I', self.data[0x28:0x2C])[0],
-            'features_data_size': struct.unpack('<I', self.data[0x2C:0x30])[0],
-            'buffers_data_offset': struct.unpack('<I', self.data[0x30:0x34])[0],
-            'buffers_data_size': struct.unpack('<I', self.data[0x34:0x38])[0],
+            'file_desc_offset': file_desc_offset,
+            'feature_flags': feature_flags,  # Added missing field
+            'feature_types': feature_types,
+            'buffer_types': buffer_types,
+            'feature_count': feature_count,
+            'buffer_count': buffer_count,
+            'features_data_offset': features_data_offset,
+            'features_data_size': features_data_size,
+            'buffers_data_offset': buffers_data_offset,
+            'buffers_data_size': buffers_data_size,
         })
         
         # Version-specific logging
@@ -600,6 +1090,14 @@ class FMDLParser:
 
 
     # --- 4.2: Feature Headers (TPP/GZ/PES Compatible) ---
+    # 8-byte feature header / 12-byte buffer header records
+    FEATURE_HEADER_DTYPE = np.dtype([('type', 'u1'), ('count_overflow', 'u1'),
+                                     ('entry_count', '<u2'), ('data_offset', '<u4')])
+    BUFFER_HEADER_DTYPE = np.dtype([('type', '<u4'), ('data_offset', '<u4'), ('data_size', '<u4')])
+    # Features worth a log line / the closing summary
+    _CRITICAL_FEATURE_TYPES = frozenset({0, 3, 4, 6, 9, 10, 11, 13, 14, 17, 21, 22})
+    _SUMMARY_FEATURE_TYPES = frozenset({0, 3, 4, 6})
+    
     def read_feature_headers(self):
         """Parse ALL Fox Engine feature headers with bounds checking"""
         logger.sub_section("Feature Headers")
@@ -613,26 +1111,25 @@ class FMDLParser:
         
         self.feature_headers.clear()
         
-        for i in range(self.header['feature_count']):
-            fh_offset = offset + (i * 8)
-            
-            feature_type = self.data[fh_offset]              # 1 byte
-            count_overflow = self.data[fh_offset + 1]        # 1 byte  
-            entry_count = struct.unpack('<H', self.data[fh_offset+2:fh_offset+4])[0]  # 2 bytes
-            data_offset = struct.unpack('<I', self.data[fh_offset+4:fh_offset+8])[0]  # 4 bytes
-            
-            total_count = (count_overflow * 0x10000) + entry_count
-            
+        # All records in one structured read; counts / absolute offsets computed column-wise
+        records = np.frombuffer(self.data, dtype=self.FEATURE_HEADER_DTYPE,
+                                count=self.header['feature_count'], offset=offset)
+        total_counts = records['count_overflow'].astype(np.uint32) * 0x10000 + records['entry_count']
+        abs_offsets = records['data_offset'].astype(np.int64) + self.header['features_data_offset']
+        
+        rows = zip(records.tolist(), total_counts.tolist(), abs_offsets.tolist())
+        
+        for i, ((feature_type, count_overflow, entry_count, data_offset), total_count, data_abs_offset) in enumerate(rows):
             # Validate data_offset
-            data_abs_offset = self.header['features_data_offset'] + data_offset
             if data_abs_offset >= len(self.data):
                 logger.warning(f"Feature {i}: Invalid data_offset 0x{data_offset:X}")
                 data_offset = 0
             
+            type_name = self.get_feature_type_name(feature_type)
             self.feature_headers.append({
                 'index': i,
                 'type': feature_type,
-                'type_name': self.get_feature_type_name(feature_type),
+                'type_name': type_name,
                 'count_overflow': count_overflow,
                 'entry_count': entry_count,
                 'total_count': total_count,
@@ -642,53 +1139,73 @@ class FMDLParser:
             })
             
             # Log only critical features (less spam)
-            if feature_type in [0,3,4,6,9,10,11,13,14,17,21,22]:
-                logger.info(f"F{feature_type:2d}: {self.get_feature_type_name(feature_type):<20} "
+            if INFO and feature_type in self._CRITICAL_FEATURE_TYPES:
+                logger.info(f"F{feature_type:2d}: {type_name:<20} "
                            f"[{total_count:>6}] @ 0x{data_offset:08X}")
         
+        # Type id -> headers of that type, indexed directly by _get_feature_header
+        table = [[] for _ in range(256)]
+        for fh in self.feature_headers:
+            table[fh['type']].append(fh)
+        self.feature_table = tuple(map(tuple, table))
+        self._feature_header_cache.clear()
+        self._feature_base_offset.clear()
+        self._param_roles = None
+        
+        # Validate every present type once - readers then only hit the two caches
+        for feature_type, headers in enumerate(self.feature_table):
+            if headers:
+                self._get_feature_header(feature_type)
+        
+        self._feature_by_name = {}
+        self._feature_name_lookup = {}
+        for fh in self.feature_headers:
+            self._feature_by_name.setdefault(fh.get('name', b'').upper(), fh)
+        
         # Summary of critical features
         critical = {fh['type']: fh['total_count'] for fh in self.feature_headers 
-                    if fh['type'] in [0,3,4,6]}
+                    if fh['type'] in self._SUMMARY_FEATURE_TYPES}
         logger.success("Features parsed", f"{len(self.feature_headers)} total, critical: {critical}")
         
         return len(self.feature_headers)
 
     # --- 4.2.1: Complete Feature Type Names (from fmdl.bt + FMDL-Studio-v2) ---
+    # Dense type id -> name tuple (single index instead of building a dict per call)
+    FEATURE_TYPE_LABELS = (
+        # Core MGSV/PES features
+        "BONE_DEFS",                # 0
+        "MESH_DEFS_GROUP_HEADERS",  # 1
+        "MESH_DEFS_GROUP_DEFS",     # 2
+        "MESH_DEFS",                # 3
+        "MATERIAL_INSTANCES",       # 4
+        "BONE_GROUPS",              # 5
+        "TEXTURE_REFS",             # 6
+        "MATERIAL_PARAMS",          # 7
+        "SHADER_ALIASES",           # 8
+        "MESH_DATA_LAYOUTS",        # 9
+        "MESH_BUFFER_HEADERS",      # 10
+        "FORMAT_ELEMENTS",          # 11
+        "STRING_HEADER",            # 12
+        "AABBS",                    # 13
+        "FILE_MESH_BUFFERS",        # 14
+        None,                       # 15
+        # LOD & Indexing
+        "LOD_INFO",                 # 16
+        "IBUFFER_SLICES",           # 17
+        # Unknown but present in some files
+        "UNK_VISIBILITY",           # 18
+        "UNK_19",                   # 19
+        "UNK_20",                   # 20
+        # Hash tables
+        "PATH_HASHES",              # 21
+        "NAME_HASHES",              # 22
+        "UNK_23",                   # 23 - PES-specific
+    )
+    
     def get_feature_type_name(self, type_id):
         """Complete feature type mapping for TPP/GZ/PES"""
-        types = {
-            # Core MGSV/PES features
-            0: "BONE_DEFS",
-            1: "MESH_DEFS_GROUP_HEADERS", 
-            2: "MESH_DEFS_GROUP_DEFS",
-            3: "MESH_DEFS",
-            4: "MATERIAL_INSTANCES",
-            5: "BONE_GROUPS",
-            6: "TEXTURE_REFS",
-            7: "MATERIAL_PARAMS",
-            8: "SHADER_ALIASES",
-            9: "MESH_DATA_LAYOUTS",
-            10: "MESH_BUFFER_HEADERS",
-            11: "FORMAT_ELEMENTS",
-            12: "STRING_HEADER",
-            13: "AABBS",
-            14: "FILE_MESH_BUFFERS",
-            
-            # LOD & Indexing
-            16: "LOD_INFO",
-            17: "IBUFFER_SLICES",
-            
-            # Hash tables
-            21: "PATH_HASHES",
-            22: "NAME_HASHES",
-            
-            # Unknown but present in some files
-            18: "UNK_VISIBILITY",
-            19: "UNK_19", 
-            20: "UNK_20",
-            23: "UNK_23",  # PES-specific
-        }
-        return types.get(type_id, f"UNK_{type_id:02X}")
+        name = self.FEATURE_TYPE_LABELS[type_id] if type_id < len(self.FEATURE_TYPE_LABELS) else None
+        return name or sys.intern(f"UNK_{type_id:02X}")
 
     # --- 4.3: Buffer Headers (Vertex/Index/Material Data) ---
     def read_buffer_headers(self):
@@ -704,16 +1221,16 @@ class FMDLParser:
         logger.start(f"Reading {self.header['buffer_count']} buffers")
         self.buffer_headers.clear()
         
-        for i in range(self.header['buffer_count']):
-            bh_offset = offset + (i * 12)
-            
-            buffer_type = struct.unpack('<I', self.data[bh_offset:bh_offset+4])[0]
-            data_offset = struct.unpack('<I', self.data[bh_offset+4:bh_offset+8])[0]
-            data_size = struct.unpack('<I', self.data[bh_offset+8:bh_offset+12])[0]
-            
-            # Absolute offset validation
-            abs_offset = self.header['buffers_data_offset'] + data_offset
-            valid = (data_size > 0 and abs_offset + data_size <= len(self.data))
+        records = np.frombuffer(self.data, dtype=self.BUFFER_HEADER_DTYPE,
+                                count=self.header['buffer_count'], offset=offset)
+        
+        # Absolute offset validation (column-wise)
+        abs_offsets = records['data_offset'].astype(np.int64) + self.header['buffers_data_offset']
+        valid_flags = (records['data_size'] > 0) & (abs_offsets + records['data_size'] <= len(self.data))
+        
+        rows = zip(records.tolist(), abs_offsets.tolist(), valid_flags.tolist())
+        
+        for i, ((buffer_type, data_offset, data_size), abs_offset, valid) in enumerate(rows):
             
             self.buffer_headers.append({
                 'index': i,
@@ -725,26 +1242,29 @@ class FMDLParser:
                 'valid': valid
             })
             
-            if valid or i < 3:  # Log first 3 + valid ones
+            if INFO and (valid or i < 3):  # Log first 3 + valid ones
                 logger.info(f"B{i}: {self.get_buffer_type_name(buffer_type):<12} "
                            f"[{data_size:,} bytes] @ 0x{data_offset:08X}")
         
         # Buffer summary
-        vbuffer_count = sum(1 for b in self.buffer_headers if b['type'] == 2)
+        vbuffer_count = int((records['type'] == 2).sum())
         logger.success("Buffers parsed", f"{len(self.buffer_headers)} total, {vbuffer_count} VBuffers")
         return len(self.buffer_headers)
 
     # --- 4.3.1: Complete Buffer Type Names ---
+    BUFFER_TYPE_LABELS = (
+        "MATERIAL_PARAMS",  # 0
+        "INDEX_BUFFER",     # 1 - Added!
+        "VERTEX_BUFFER",    # 2 - Fixed name
+        "STRINGS",          # 3
+        "UNK_4",            # 4 - PES-specific
+    )
+    
     def get_buffer_type_name(self, type_id):
         """Buffer types from FMDL-Studio-v2/FoxMesh.cs"""
-        types = {
-            0: "MATERIAL_PARAMS",
-            1: "INDEX_BUFFER",      # Added!
-            2: "VERTEX_BUFFER",     # Fixed name
-            3: "STRINGS",  
-            4: "UNK_4",             # PES-specific
-        }
-        return types.get(type_id, f"UNK_{type_id}")
+        if type_id < len(self.BUFFER_TYPE_LABELS):
+            return self.BUFFER_TYPE_LABELS[type_id]
+        return f"UNK_{type_id}"
 
 
         
@@ -763,47 +1283,32 @@ class FMDLParser:
     def read_names(self):
         """Parse NAME_HASHES (feature 22) - bone/material/texture names"""
         logger.sub_section("Names (StrCode64)")
-        fh = self._get_feature_header(22)  # NAME_HASHES
-        
-        if not fh:
-            logger.warning("No NAME_HASHES feature (22)")
+        records = self._read_feature_records(22, self.HASH_DTYPE, "names")  # NAME_HASHES
+        if records is None:
             return 0
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        
-        # Bounds check
-        if offset + count * 8 > len(self.data):
-            logger.warning(f"Names truncated: need {count*8} bytes from 0x{offset:X}")
-            count = (len(self.data) - offset) // 8
-        
-        logger.start(f"Loading {count} names @ 0x{offset:08X}")
-        self.names.clear()
-        
-        for i in range(count):
-            name_offset = offset + (i * 8)
-            if name_offset + 8 > len(self.data):
-                break
-                
-            name_hash = struct.unpack('<Q', self.data[name_offset:name_offset+8])[0]
-            
-            # Dictionary lookup + fallback (PES/MGSV compatible)
-            resolved_name = self.dict.get_bone_name(name_hash) if self.dict else None
-            display_name = resolved_name or f"N{i:04d}_{name_hash:016X}"
-            
-            self.names.append({
-                'index': i,
-                'hash': name_hash,
-                'resolved_name': resolved_name,
-                'display_name': display_name,
-                'hash_hex': f"{name_hash:016X}"
-            })
+        self.name_hashes = hashes = records
+        resolved = np.full(len(hashes), None, dtype=object)
+        
+        # Dictionary lookup + fallback (PES/MGSV compatible) - one batch lookup;
+        # dictionary names are interned at load time
+        if self.dict:
+            resolved[:] = self.dict.get_bone_names_bulk(hashes)
+        
+        # display_name / hash_hex are formatted on access, not for all N entries
+        self._mat_name_cache.clear()
+        self._tex_name_cache.clear()
+        self.names = RecordTable(
+            {'hash': hashes, 'resolved_name': resolved},
+            derived={'index': _row_index, 'display_name': self._display_name,
+                     'hash_hex': self._hash_hex},
+            fields=('index', 'hash', 'resolved_name', 'display_name', 'hash_hex'))
         
         logger.success("Names loaded", f"{len(self.names)} entries")
         
-        # Smart sample logging (first 3 + bone-related)
-        bone_names = [n for n in self.names[:10] if "bone" in n['display_name'].lower() or n['resolved_name']]
-        if self.names:
+        # Smart sample logging (first 3 + bone-related) - debug only, so the
+        # lazy display names are never formatted otherwise
+        if DEBUG and self.names:
+            bone_names = [n for n in self.names[:10] if "bone" in n['display_name'].lower() or n['resolved_name']]
             logger.debug(f"First: {self.names[0]['display_name']}")
             logger.debug(f"Last:  {self.names[-1]['display_name']}")
             if bone_names:
@@ -815,76 +1320,78 @@ class FMDLParser:
     def read_paths(self):
         """Parse PATH_HASHES (feature 21) - texture file paths"""
         logger.sub_section("Paths (PathCode64)")
-        fh = self._get_feature_header(21)  # PATH_HASHES
-        
-        if not fh:
-            logger.warning("No PATH_HASHES feature (21)")
+        records = self._read_feature_records(21, self.HASH_DTYPE, "paths")  # PATH_HASHES
+        if records is None:
             return 0
+        self.path_hashes = hashes = records
+        fallback_suffix = TEXTURE_SUFFIXES.get(self.header['engine'], '_tex')
+        resolved = np.empty(len(hashes), dtype=object)
+        is_texture = np.zeros(len(hashes), dtype=bool)
         
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        
-        # Bounds check
-        if offset + count * 8 > len(self.data):
-            logger.warning(f"Paths truncated: need {count*8} bytes")
-            count = (len(self.data) - offset) // 8
-        
-        logger.start(f"Loading {count} paths @ 0x{offset:08X}")
-        self.paths.clear()
-        
-        for i in range(count):
-            path_offset = offset + (i * 8)
-            if path_offset + 8 > len(self.data):
-                break
-                
-            path_hash = struct.unpack('<Q', self.data[path_offset:path_offset+8])[0]
-            
+        for i, path_hash in enumerate(hashes.tolist()):
             # QAR dictionary lookup (texture paths)
             resolved_path = self.dict.get_texture_path(path_hash) if self.dict else None
             
             # Fallback: construct from hash + suffix patterns
             if not resolved_path:
                 # Common Fox Engine texture naming
-                suffix = TEXTURE_SUFFIXES.get(self.header['engine'], '_tex')
-                resolved_path = f"tex_{path_hash:016X}{suffix}"
+                resolved_path = f"tex_{path_hash:016X}{fallback_suffix}"
             
-            self.paths.append({
-                'index': i,
-                'hash': path_hash,
-                'resolved_path': resolved_path,
-                'hash_hex': f"{path_hash:016X}",
-                'is_texture': 'tex_' in resolved_path.lower() or '.ftex' in resolved_path.lower()
-            })
+            resolved[i] = resolved_path
+            is_texture[i] = 'tex_' in resolved_path.lower() or '.ftex' in resolved_path.lower()
+        
+        self._tex_path_cache.clear()
+        self.paths = RecordTable(
+            {'hash': hashes, 'resolved_path': resolved, 'is_texture': is_texture},
+            derived={'index': _row_index, 'hash_hex': self._hash_hex},
+            fields=('index', 'hash', 'resolved_path', 'hash_hex', 'is_texture'))
         
         logger.success("Paths loaded", f"{len(self.paths)} entries")
         
         # Texture path samples
-        texture_paths = [p for p in self.paths[:5] if p['is_texture']]
-        if self.paths:
+        if DEBUG and self.paths:
+            texture_paths = [p for p in self.paths[:5] if p['is_texture']]
             logger.debug(f"First: {self.paths[0]['resolved_path'][:60]}")
             if texture_paths:
                 logger.debug(f"Texture: {texture_paths[0]['resolved_path'][:60]}")
         
         return len(self.paths)
 
+    @staticmethod
+    def _hash_hex(table, i):
+        return f"{table.columns['hash'][i].item():016X}"
+    
+    @staticmethod
+    def _display_name(table, i):
+        return table.columns['resolved_name'][i] or f"N{i:04d}_{table.columns['hash'][i].item():016X}"
+
     # --- 4.4.2: Feature Header Lookup (Optimized) ---
     def _get_feature_header(self, feature_type):
-        """Fast lookup for feature header by type"""
+        """Fast lookup for feature header by type (validated once, then cached)"""
+        try:
+            return self._feature_header_cache[feature_type]
+        except KeyError:
+            pass
+        
         if not self.feature_headers:
             logger.warning("_get_feature_header called before read_feature_headers")
             return None
         
-        for fh in self.feature_headers:
-            if fh['type'] == feature_type:
-                # Validate feature data exists
-                abs_offset = self.header['features_data_offset'] + fh['data_offset']
-                if abs_offset + fh['total_count'] * 8 <= len(self.data):
-                    return fh
-                else:
-                    logger.warning(f"Feature {feature_type} data truncated")
-        
-        logger.debug(f"No valid feature header found for type {feature_type}")
-        return None
+        found = None
+        for fh in self.feature_table[feature_type]:
+            # Validate feature data exists
+            abs_offset = self.header['features_data_offset'] + fh['data_offset']
+            if abs_offset + fh['total_count'] * 8 <= len(self.data):
+                found = fh
+                self._feature_base_offset[feature_type] = abs_offset
+                break
+            else:
+                logger.warning(f"Feature {feature_type} data truncated")
+        
+        if found is None:
+            logger.debug(f"No valid feature header found for type {feature_type}")
+        self._feature_header_cache[feature_type] = found
+        return found
 
       
   
@@ -899,61 +1406,42 @@ class FMDLParser:
   
   
     # --- 4.4: Bone Definitions (FmdlBone struct from Fmdl.cs) ---
+    # 0x30-byte FmdlBone record
+    BONE_DTYPE = np.dtype([('name_index', '<u2'), ('parent', '<i2'), ('bbox', '<u2'), ('unk', '<u2'),
+                           ('pad', 'V8'), ('local', '<f4', (4,)), ('world', '<f4', (4,))])
+    
     def read_bone_defs(self):
         """Parse BONES (feature 0) - Skeleton hierarchy with AABB links"""
         logger.sub_section("Reading Bone Definitions")
-        fh = self._get_feature_header(0)  # BONES
-        
-        if not fh:
-            logger.warning("No BONES feature (0)")
+        records = self._read_feature_records(0, self.BONE_DTYPE, "bones")  # BONES
+        if records is None:
             return 0
         
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        bone_size = 0x30  # 48 bytes per FmdlBone struct
-        
-        # Bounds check
-        if offset + count * bone_size > len(self.data):
-            logger.warning(f"Bones truncated: {count} need {count*bone_size} bytes")
-            count = (len(self.data) - offset) // bone_size
-        
-        logger.start(f"Reading {count} bones @ 0x{offset:08X}")
-        self.bones.clear()
-        
-        for i in range(count):
-            bone_offset = offset + (i * bone_size)
-            if bone_offset + bone_size > len(self.data):
-                break
-            
-            # ✅ اصلاح شده: ساختار درست FmdlBone از Fmdl.cs
-            # nameIndex (2), parentIndex (2), boundingBoxIndex (2), unknown0 (2), padding (8)
-            # localPosition (16), worldPosition (16)
-            name_index = struct.unpack('<H', self.data[bone_offset:bone_offset+2])[0]
-            parent_index = struct.unpack('<h', self.data[bone_offset+2:bone_offset+4])[0]  # signed!
-            bounding_box_index = struct.unpack('<H', self.data[bone_offset+4:bone_offset+6])[0]
-            unknown0 = struct.unpack('<H', self.data[bone_offset+6:bone_offset+8])[0]
-            
-            # Skip 8 bytes padding
-            local_pos = struct.unpack('<4f', self.data[bone_offset+16:bone_offset+32])
-            world_pos = struct.unpack('<4f', self.data[bone_offset+32:bone_offset+48])
-            
-            # ✅ اصلاح شده: نام‌گذاری بر اساس hash یا دیکشنری
-            bone_name = self._get_bone_name(name_index, i)
-            
-            self.bones.append({
-                'index': i,
-                'name_index': name_index,
-                'name': bone_name,
-                'parent': parent_index,
-                'bounding_box_index': bounding_box_index,
-                'unknown0': unknown0,
-                'local_position': local_pos,
-                'world_position': world_pos,
-                'aabb': None,  # Will be linked later
-            })
-            
-            parent_str = f"→{parent_index}" if parent_index >= 0 else "ROOT"
-            if i < 10:
+        # ✅ اصلاح شده: ساختار درست FmdlBone از Fmdl.cs
+        # nameIndex (2), parentIndex (2, signed!), boundingBoxIndex (2), unknown0 (2), padding (8)
+        # localPosition (16), worldPosition (16)
+        name_indices = records['name_index']
+        parents = records['parent']
+        bbox_indices = records['bbox']
+        
+        # ✅ اصلاح شده: نام‌گذاری بر اساس hash یا دیکشنری
+        names = np.empty(len(records), dtype=object)
+        for i, name_index in enumerate(name_indices.tolist()):
+            names[i] = self._get_bone_name(name_index, i)
+        
+        self.bones = RecordTable(
+            {'name_index': name_indices, 'name': names, 'parent': parents,
+             'bounding_box_index': bbox_indices, 'unknown0': records['unk'],
+             'local_position': records['local'], 'world_position': records['world'],
+             'aabb': np.full(len(records), None, dtype=object)},  # Will be linked later
+            derived={'index': _row_index},
+            fields=('index', 'name_index', 'name', 'parent', 'bounding_box_index', 'unknown0',
+                    'local_position', 'world_position', 'aabb'))
+        
+        if INFO:
+            for i, (bone_name, parent_index, bounding_box_index) in enumerate(
+                    zip(names[:10], parents[:10].tolist(), bbox_indices[:10].tolist())):
+                parent_str = f"→{parent_index}" if parent_index >= 0 else "ROOT"
                 logger.info(f"Bone {i:2d}: {bone_name:<20} {parent_str} AABB:{bounding_box_index}")
         
         logger.success("Bones parsed", f"{len(self.bones)} bones")
@@ -966,15 +1454,15 @@ class FMDLParser:
     def _get_bone_name(self, name_index, bone_index):
         """Get bone name from StrCode64 or dictionary"""
         # Try dictionary first
-        if name_index < len(self.names):
-            name_hash = self.names[name_index].get('hash')
+        if name_index < len(self.name_hashes):
+            name_hash = self.name_hashes[name_index].item()
             if name_hash and self.dict:
                 dict_name = self.dict.get_bone_name(name_hash)
                 if dict_name and not dict_name.startswith("Bone_"):
                     return dict_name
         
         # Try StrCode64 lookup (for TPP format)
-        if hasattr(self, 'str_code64s') and name_index < len(self.str_code64s):
+        if name_index < len(self.str_code64s):
             hash_val = self.str_code64s[name_index]
             if self.dict:
                 dict_name = self.dict.get_bone_name(hash_val)
@@ -987,50 +1475,39 @@ class FMDLParser:
     
     def _link_bone_aabbs(self):
         """Link bounding boxes to bones"""
-        if not self.aabbs or not self.bones:
+        if not self.bones:
+            return
+        
+        # Per-bone AABB index (-1 = none), also used to gather the AABB records
+        bb_idx = self.bones.columns['bounding_box_index'].astype(np.int32)
+        self.bone_aabb_index = np.where(bb_idx < len(self.aabbs), bb_idx, np.int32(-1))
+        if not self.aabbs:
             return
         
-        for bone in self.bones:
-            bb_idx = bone['bounding_box_index']
-            if 0 <= bb_idx < len(self.aabbs):
-                bone['aabb'] = self.aabbs[bb_idx]
+        linked = self.bone_aabb_index >= 0
+        aabb_objs = np.fromiter(self.aabbs, dtype=object, count=len(self.aabbs))
+        self.bones.columns['aabb'][linked] = aabb_objs[self.bone_aabb_index[linked]]
     
     
     
     
     # --- 4.6: Bone Groups (FmdlBoneGroup struct) ---
+    # unknown0 (2), boneIndexCount (2), then bone indices (max 32)
+    BONE_GROUP_DTYPE = np.dtype([('unknown0', '<u2'), ('bone_count', '<u2'), ('indices', '<u2', (32,))])
+    
     def read_bone_groups(self):
         """Parse BONE_GROUPS (feature 5) - Bone index mappings per mesh"""
         logger.sub_section("Reading Bone Groups")
-        fh = self._get_feature_header(5)  # BONE_GROUPS
-        
-        if not fh:
-            logger.warning("No BONE_GROUPS feature (5)")
+        records = self._read_feature_records(5, self.BONE_GROUP_DTYPE, "bone groups")  # BONE_GROUPS
+        if records is None:
             return 0
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        
-        logger.start(f"Reading {count} bone groups @ 0x{offset:08X}")
         self.bone_groups = []
         
-        for i in range(count):
-            # Each bone group: unknown0 (2), boneIndexCount (2), then bone indices
-            group_offset = offset + (i * 0x44)  # 68 bytes fixed size
-            if group_offset + 4 > len(self.data):
-                break
-            
-            unknown0 = struct.unpack('<H', self.data[group_offset:group_offset+2])[0]
-            bone_count = struct.unpack('<H', self.data[group_offset+2:group_offset+4])[0]
-            
-            # Read bone indices (max 32)
-            bone_indices = []
-            for j in range(min(bone_count, 32)):
-                idx_offset = group_offset + 4 + (j * 2)
-                if idx_offset + 2 > len(self.data):
-                    break
-                bone_idx = struct.unpack('<H', self.data[idx_offset:idx_offset+2])[0]
-                bone_indices.append(bone_idx)
+        # Whole table in one structured read, rows converted in bulk
+        rows = zip(records['unknown0'].tolist(), records['bone_count'].tolist(), records['indices'].tolist())
+        
+        for i, (unknown0, bone_count, bone_indices) in enumerate(rows):
+            del bone_indices[bone_count:]
             
             self.bone_groups.append({
                 'index': i,
@@ -1039,7 +1516,7 @@ class FMDLParser:
                 'bone_indices': bone_indices,
             })
             
-            if i < 5:
+            if INFO and i < 5:
                 logger.info(f"BoneGroup {i:2d}: {len(bone_indices)} bones - {bone_indices[:8]}...")
         
         logger.success("Bone groups parsed", f"{len(self.bone_groups)} groups")
@@ -1053,69 +1530,43 @@ class FMDLParser:
     
     
     # --- 4.5: Mesh Definitions (FmdlMeshInfo struct) ---
+    # 0x30-byte FmdlMeshInfo record
+    MESH_DTYPE = np.dtype([('alpha_enum', 'u1'), ('shadow_enum', 'u1'), ('unknown0', 'u1'), ('unknown1', 'u1'),
+                           ('material_index', '<u2'), ('bone_group_index', '<u2'),
+                           ('mesh_index', '<u2'), ('vertex_count', '<u2'), ('pad0', 'V4'),
+                           ('first_face_vertex', '<u4'), ('face_vertex_count', '<u4'),
+                           ('first_face_info', '<u8'), ('pad1', 'V16')])
+    
     def read_mesh_defs(self):
         """Parse MESH_INFO (feature 3) - Complete mesh definitions"""
         logger.sub_section("Reading Mesh Definitions")
-        fh = self._get_feature_header(3)  # MESH_INFO
-        
-        if not fh:
-            logger.warning("No MESH_INFO feature (3)")
+        records = self._read_feature_records(3, self.MESH_DTYPE, "meshes")  # MESH_INFO
+        if records is None:
             return 0
         
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        mesh_size = 0x30  # 48 bytes per FmdlMeshInfo
-        
-        # Bounds check
-        if offset + count * mesh_size > len(self.data):
-            logger.warning(f"Mesh defs truncated: {count} need {count*mesh_size} bytes")
-            count = (len(self.data) - offset) // mesh_size
-        
-        logger.start(f"Reading {count} meshes @ 0x{offset:08X}")
-        self.meshes.clear()
-        
-        for i in range(count):
-            mesh_offset = offset + (i * mesh_size)
-            if mesh_offset + mesh_size > len(self.data):
-                break
-            
-            # ✅ اصلاح شده: ساختار درست FmdlMeshInfo از Fmdl.cs
-            # alphaEnum (1), shadowEnum (1), unknown0 (1), unknown1 (1)
-            # materialInstanceIndex (2), boneGroupIndex (2), index (2), vertexCount (2)
-            # padding (4), firstFaceVertexIndex (4), faceVertexCount (4)
-            # firstFaceInfoIndex (8), padding (16)
-            
-            alpha_enum = self.data[mesh_offset]
-            shadow_enum = self.data[mesh_offset + 1]
-            unknown0 = self.data[mesh_offset + 2]
-            unknown1 = self.data[mesh_offset + 3]
-            
-            material_idx = struct.unpack('<H', self.data[mesh_offset+4:mesh_offset+6])[0]
-            bone_group_idx = struct.unpack('<H', self.data[mesh_offset+6:mesh_offset+8])[0]
-            mesh_idx = struct.unpack('<H', self.data[mesh_offset+8:mesh_offset+10])[0]
-            vert_count = struct.unpack('<H', self.data[mesh_offset+10:mesh_offset+12])[0]
-            
-            # Skip 4 bytes padding
-            first_face_vert = struct.unpack('<I', self.data[mesh_offset+16:mesh_offset+20])[0]
-            face_vert_count = struct.unpack('<I', self.data[mesh_offset+20:mesh_offset+24])[0]
-            first_face_info = struct.unpack('<Q', self.data[mesh_offset+24:mesh_offset+32])[0]
-            
-            self.meshes.append({
-                'index': i,
-                'mesh_index': mesh_idx,
-                'alpha_enum': alpha_enum,
-                'shadow_enum': shadow_enum,
-                'material_index': material_idx,
-                'bone_group_index': bone_group_idx,
-                'vertex_count': vert_count,
-                'vertices_start_index': first_face_vert,  # This is actually face vertex start
-                'face_vertex_count': face_vert_count,
-                'first_face_info_index': first_face_info,
-                'unknown0': unknown0,
-                'unknown1': unknown1,
-            })
-            
-            if i < 5:
+        # ✅ اصلاح شده: ساختار درست FmdlMeshInfo از Fmdl.cs
+        # alphaEnum (1), shadowEnum (1), unknown0 (1), unknown1 (1)
+        # materialInstanceIndex (2), boneGroupIndex (2), index (2), vertexCount (2)
+        # padding (4), firstFaceVertexIndex (4), faceVertexCount (4)
+        # firstFaceInfoIndex (8), padding (16)
+        
+        self.meshes = RecordTable(
+            {'mesh_index': records['mesh_index'], 'alpha_enum': records['alpha_enum'],
+             'shadow_enum': records['shadow_enum'], 'material_index': records['material_index'],
+             'bone_group_index': records['bone_group_index'], 'vertex_count': records['vertex_count'],
+             'vertices_start_index': records['first_face_vertex'],  # This is actually face vertex start
+             'face_vertex_count': records['face_vertex_count'],
+             'first_face_info_index': records['first_face_info'],
+             'unknown0': records['unknown0'], 'unknown1': records['unknown1']},
+            derived={'index': _row_index},
+            fields=('index', 'mesh_index', 'alpha_enum', 'shadow_enum', 'material_index',
+                    'bone_group_index', 'vertex_count', 'vertices_start_index', 'face_vertex_count',
+                    'first_face_info_index', 'unknown0', 'unknown1'))
+        
+        if INFO:
+            for i, (vert_count, face_vert_count, material_idx, bone_group_idx) in enumerate(zip(
+                    records['vertex_count'][:5].tolist(), records['face_vertex_count'][:5].tolist(),
+                    records['material_index'][:5].tolist(), records['bone_group_index'][:5].tolist())):
                 logger.info(f"Mesh {i:2d}: verts={vert_count:4d}, faces={face_vert_count//3:4d}, "
                            f"mat={material_idx}, boneGroup={bone_group_idx}")
         
@@ -1133,47 +1584,31 @@ class FMDLParser:
 
 
     # --- 4.7: Material Instances (FmdlMaterialInstance struct) - اصلاح شده ---
+    MATERIAL_INSTANCE_DTYPE = _record_dtype((
+        ('name_index', '<u2', 0), ('material_type_idx', '<u2', 4), ('texture_count', 'u1', 6),
+        ('param_count', 'u1', 7), ('first_tex_idx', '<u2', 8), ('first_param_idx', '<u2', 10)), 0x10)
+    
     def read_materials(self):
         """Parse MATERIAL_INSTANCES (feature 4) - Complete material pipeline with shader names"""
         logger.sub_section("Reading Material Instances")
-        fh = self._get_feature_header(4)  # MATERIAL_INSTANCES
-        
-        if not fh:
-            logger.warning("No MATERIAL_INSTANCES feature (4)")
+        records = self._read_feature_records(4, self.MATERIAL_INSTANCE_DTYPE, "materials")  # MATERIAL_INSTANCES
+        if records is None:
             return 0
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        mat_size = 0x10  # 16 bytes per FmdlMaterialInstance
-        
-        # Bounds check
-        if offset + count * mat_size > len(self.data):
-            logger.warning(f"Materials truncated: {count} need {count*mat_size} bytes")
-            count = (len(self.data) - offset) // mat_size
-        
-        logger.start(f"Reading {count} materials @ 0x{offset:08X}")
         self.materials.clear()
         
         # Ensure we have parsed materials list (feature 8) for shader names
-        if not hasattr(self, 'material_types'):
+        if self.material_types is None:
             self._read_material_types()
+        # Texture roles (feature 7) for every parameter, before the per-material loop
+        self._prefetch_param_roles()
         
-        for i in range(count):
-            mat_offset = offset + (i * mat_size)
-            if mat_offset + mat_size > len(self.data):
-                break
-            
-            # ✅ اصلاح شده: ساختار درست FmdlMaterialInstance از Fmdl.cs
-            # nameIndex (2), padding (2), materialIndex (2), 
-            # textureCount (1), parameterCount (1), 
-            # firstTextureIndex (2), firstParameterIndex (2), padding (4)
-            name_index = struct.unpack('<H', self.data[mat_offset:mat_offset+2])[0]
-            # Skip 2 bytes padding
-            material_type_idx = struct.unpack('<H', self.data[mat_offset+4:mat_offset+6])[0]
-            texture_count = self.data[mat_offset + 6]
-            param_count = self.data[mat_offset + 7]
-            first_tex_idx = struct.unpack('<H', self.data[mat_offset+8:mat_offset+10])[0]
-            first_param_idx = struct.unpack('<H', self.data[mat_offset+10:mat_offset+12])[0]
+        # ✅ اصلاح شده: ساختار درست FmdlMaterialInstance از Fmdl.cs
+        # nameIndex (2), padding (2), materialIndex (2), 
+        # textureCount (1), parameterCount (1), 
+        # firstTextureIndex (2), firstParameterIndex (2), padding (4)
+        rows = records.tolist()
+        for i, (name_index, material_type_idx, texture_count, param_count,
+                first_tex_idx, first_param_idx) in enumerate(rows):
             
             # Resolve names
             mat_name = self._resolve_material_name(name_index)
@@ -1185,26 +1620,29 @@ class FMDLParser:
             # Get parameter assignments for this material
             param_assignments = self._get_material_params(first_param_idx, param_count)
             
-            self.materials.append({
-                'index': i,
-                'name_index': name_index,
-                'name': mat_name,
-                'shader_name': shader_name,
-                'material_type_index': material_type_idx,
-                'texture_count': texture_count,
-                'parameter_count': param_count,
-                'texture_assignments': texture_assignments,
-                'parameter_assignments': param_assignments,
-                'preset': self._get_material_preset(shader_name),
-            })
-            
-            if i < 5:
+            self.materials.append(MaterialRecord(
+                index=i,
+                name_index=name_index,
+                name=mat_name,
+                shader_name=shader_name,
+                material_type_index=material_type_idx,
+                texture_count=texture_count,
+                parameter_count=param_count,
+                texture_assignments=texture_assignments,
+                parameter_assignments=param_assignments,
+                preset=self._get_material_preset(shader_name),
+            ))
+            
+            if INFO and i < 5:
                 logger.info(f"Mat{i:2d}: {mat_name:<25} shader={shader_name:<25} "
                            f"tex={texture_count} params={param_count}")
         
         logger.success("Materials parsed", f"{len(self.materials)} materials")
         return len(self.materials)
     
+    # Material types (feature 8) / parameters (feature 7): two u16 indices per record
+    INDEX_PAIR_DTYPE = np.dtype([('name_index', '<u2'), ('ref_index', '<u2')])
+    
     def _read_material_types(self):
         """Read MATERIALS (feature 8) for shader/technique names"""
         fh = self._get_feature_header(8)  # MATERIALS
@@ -1212,18 +1650,13 @@ class FMDLParser:
             self.material_types = []
             return
         
-        offset = self.header['features_data_offset'] + fh['data_offset']
+        offset = self._feature_base_offset[8]
         count = fh['total_count']
         
+        count = min(count, (len(self.data) - offset) // 4)  # 4 bytes: nameIndex, typeIndex
+        
         self.material_types = []
-        for i in range(count):
-            type_offset = offset + (i * 4)  # 4 bytes: nameIndex, typeIndex
-            if type_offset + 4 > len(self.data):
-                break
-            
-            name_idx = struct.unpack('<H', self.data[type_offset:type_offset+2])[0]
-            type_idx = struct.unpack('<H', self.data[type_offset+2:type_offset+4])[0]
-            
+        for i, (name_idx, type_idx) in enumerate(self._read_records(self.INDEX_PAIR_DTYPE, offset, count)):
             shader_name = self._resolve_material_name(name_idx)
             technique_name = self._resolve_material_name(type_idx)
             
@@ -1234,8 +1667,14 @@ class FMDLParser:
             })
     
     def _resolve_material_name(self, name_index):
-        """Resolve material/shader name from StrCode64"""
-        if hasattr(self, 'str_code64s') and name_index < len(self.str_code64s):
+        """Resolve material/shader name from StrCode64 (memoized per index)"""
+        name = self._mat_name_cache.get(name_index)
+        if name is None:
+            name = self._mat_name_cache[name_index] = self._lookup_material_name(name_index)
+        return name
+    
+    def _lookup_material_name(self, name_index):
+        if name_index < len(self.str_code64s):
             hash_val = self.str_code64s[name_index]
             if self.dict:
                 name = self.dict.get_bone_name(hash_val)
@@ -1250,22 +1689,26 @@ class FMDLParser:
     
     def _resolve_shader_name(self, material_type_idx):
         """Get shader name from material type index"""
-        if 0 <= material_type_idx < len(getattr(self, 'material_types', [])):
+        if self.material_types and 0 <= material_type_idx < len(self.material_types):
             return self.material_types[material_type_idx]['shader_name']
         return "fox3ddf_blin"  # Default fallback
     
     def _get_material_textures(self, first_idx, count):
         """Get texture assignments for material"""
         assignments = []
-        if not hasattr(self, 'texture_refs'):
+        if not self.texture_refs:
             return assignments
         
+        # Texture roles from material parameters (feature 7), resolved once per file
+        if self._param_roles is None:
+            self._prefetch_param_roles()
+        roles = self._param_roles
+        
         for i in range(count):
             tex_idx = first_idx + i
             if tex_idx < len(self.texture_refs):
                 tex_ref = self.texture_refs[tex_idx]
-                # Get texture role from material parameters (feature 7)
-                role = self._get_texture_role(tex_idx)
+                role = roles[tex_idx] if tex_idx < len(roles) else 'Base_Tex_SRGB'
                 assignments.append({
                     'texture_index': tex_idx,
                     'texture_ref': tex_ref,
@@ -1275,28 +1718,31 @@ class FMDLParser:
     
     def _get_texture_role(self, tex_param_idx):
         """Get texture role from MATERIAL_PARAMETERS (feature 7)"""
+        if self._param_roles is None:
+            self._prefetch_param_roles()
+        if tex_param_idx < len(self._param_roles):
+            return self._param_roles[tex_param_idx]
+        return 'Base_Tex_SRGB'
+    
+    def _prefetch_param_roles(self):
+        """Resolve every parameter name (= texture role) in one table read"""
         fh = self._get_feature_header(7)  # MATERIAL_PARAMETERS
         if not fh:
-            return 'Base_Tex_SRGB'
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        param_offset = offset + (tex_param_idx * 4)  # 4 bytes per param
-        
-        if param_offset + 4 > len(self.data):
-            return 'Base_Tex_SRGB'
+            self._param_roles = []
+            return
         
-        name_idx = struct.unpack('<H', self.data[param_offset:param_offset+2])[0]
-        ref_idx = struct.unpack('<H', self.data[param_offset+2:param_offset+4])[0]
+        offset = self._feature_base_offset[7]
+        count = min(fh['total_count'], (len(self.data) - offset) // 4)  # 4 bytes per param
         
-        # Resolve parameter name as role
-        role = self._resolve_material_name(name_idx)
-        return role if role else 'Base_Tex_SRGB'
+        # Resolve parameter name as role (ref index unused here)
+        self._param_roles = [self._resolve_material_name(name_idx) or 'Base_Tex_SRGB'
+                             for name_idx, _ref_idx in self._read_records(self.INDEX_PAIR_DTYPE, offset, count)]
     
     def _get_material_params(self, first_idx, count):
         """Get parameter assignments for material"""
         params = []
         fh = self._get_feature_header(0)  # Section 1 block 0 for vectors
-        if not fh or not hasattr(self, 'material_parameter_vectors'):
+        if not fh or not self.material_parameter_vectors:
             return params
         
         for i in range(count):
@@ -1305,35 +1751,43 @@ class FMDLParser:
                 params.append(self.material_parameter_vectors[param_idx])
         return params
     
+    # Map shader names to texture roles
+    MATERIAL_PRESETS = {
+        'fox3ddf_blin': {
+            'textures': ['Base_Tex_SRGB', 'NormalMap_Tex_NRM', 'SpecularMap_Tex_LIN'],
+            'shader': 'fox3ddf_blin',
+        },
+        'fox3ddf_ggx': {
+            'textures': ['Base_Tex_SRGB', 'NormalMap_Tex_NRM', 'SpecularMap_Tex_LIN', 'MetalnessMap_Tex_LIN'],
+            'shader': 'fox3ddf_ggx',
+        },
+        'fox3ddc_blin': {
+            'textures': ['Base_Tex_SRGB', 'NormalMap_Tex_NRM'],
+            'shader': 'fox3ddc_blin',
+        },
+        'tpp3ddc_blin': {
+            'textures': ['Base_Tex_SRGB', 'NormalMap_Tex_NRM', 'SpecularMap_Tex_LIN'],
+            'shader': 'tpp3ddc_blin',
+        },
+    }
+    _PRESET_ITEMS = tuple(MATERIAL_PRESETS.items())
+    
     def _get_material_preset(self, shader_name):
-        """Get material preset based on shader name"""
-        # Map shader names to texture roles
-        preset_map = {
-            'fox3ddf_blin': {
-                'textures': ['Base_Tex_SRGB', 'NormalMap_Tex_NRM', 'SpecularMap_Tex_LIN'],
-                'shader': 'fox3ddf_blin',
-            },
-            'fox3ddf_ggx': {
-                'textures': ['Base_Tex_SRGB', 'NormalMap_Tex_NRM', 'SpecularMap_Tex_LIN', 'MetalnessMap_Tex_LIN'],
-                'shader': 'fox3ddf_ggx',
-            },
-            'fox3ddc_blin': {
-                'textures': ['Base_Tex_SRGB', 'NormalMap_Tex_NRM'],
-                'shader': 'fox3ddc_blin',
-            },
-            'tpp3ddc_blin': {
-                'textures': ['Base_Tex_SRGB', 'NormalMap_Tex_NRM', 'SpecularMap_Tex_LIN'],
-                'shader': 'tpp3ddc_blin',
-            },
-        }
+        """Get material preset based on shader name (cached per shader)"""
+        preset = self._preset_cache.get(shader_name)
+        if preset is not None:
+            return preset
         
         # Find matching preset
         shader_lower = shader_name.lower()
-        for key, preset in preset_map.items():
+        preset = self.MATERIAL_PRESETS['fox3ddf_blin']  # Default
+        for key, candidate in self._PRESET_ITEMS:
             if key in shader_lower:
-                return preset
+                preset = candidate
+                break
         
-        return preset_map['fox3ddf_blin']  # Default
+        self._preset_cache[shader_name] = preset
+        return preset
 
         
         
@@ -1344,60 +1798,49 @@ class FMDLParser:
     
     
     # --- 4.8: Texture References (FmdlTexture struct) - اصلاح شده ---
+    TEXTURE_REF_DTYPE = np.dtype([('name_index', '<u2'), ('path_index', '<u2')])
+    
     def read_texture_refs(self):
         """Parse TEXTURES (feature 6) - Complete texture lookup with hash resolution"""
         logger.sub_section("Reading Texture References")
-        fh = self._get_feature_header(6)  # TEXTURES
-        
-        if not fh:
-            logger.warning("No TEXTURES feature (6)")
+        records = self._read_feature_records(6, self.TEXTURE_REF_DTYPE, "texture refs")  # TEXTURES
+        if records is None:
             return 0
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        texref_size = 4  # 4 bytes per FmdlTexture (nameIndex:2, pathIndex:2)
-        
-        # Bounds check
-        if offset + count * texref_size > len(self.data):
-            logger.warning(f"Texture refs truncated: {count} need {count*texref_size} bytes")
-            count = (len(self.data) - offset) // texref_size
-        
-        logger.start(f"Reading {count} texture refs @ 0x{offset:08X}")
         self.texture_refs.clear()
         
-        for i in range(count):
-            tex_offset = offset + (i * texref_size)
-            if tex_offset + texref_size > len(self.data):
-                break
-            
-            # ✅ اصلاح شده: ساختار درست FmdlTexture از Fmdl.cs
-            name_index = struct.unpack('<H', self.data[tex_offset:tex_offset+2])[0]
-            path_index = struct.unpack('<H', self.data[tex_offset+2:tex_offset+4])[0]
+        # ✅ اصلاح شده: ساختار درست FmdlTexture از Fmdl.cs
+        rows = records.tolist()
+        for i, (name_index, path_index) in enumerate(rows):
             
             # Resolve names using dictionary
             tex_name = self._resolve_texture_name(name_index)
             tex_path = self._resolve_texture_path(path_index)
             
-            self.texture_refs.append({
-                'index': i,
-                'name_index': name_index,
-                'path_index': path_index,
-                'name': tex_name,
-                'path': tex_path,
-                'full_path': f"{tex_path}{tex_name}" if tex_path else tex_name,
-                'role': None,  # Will be set by material parameter
-            })
+            self.texture_refs.append(TextureRefRecord(
+                index=i,
+                name_index=name_index,
+                path_index=path_index,
+                name=tex_name,
+                path=tex_path,
+                role=None,  # Will be set by material parameter
+            ))
             
-            if i < 10:
+            if INFO and i < 10:
                 logger.info(f"Tex{i:2d}: {tex_name:<30} path={tex_path[:40] if tex_path else 'None':<40}")
         
         logger.success("Texture refs parsed", f"{len(self.texture_refs)} textures")
         return len(self.texture_refs)
     
     def _resolve_texture_name(self, name_index):
-        """Resolve texture name from StrCode64 or dictionary"""
+        """Resolve texture name from StrCode64 or dictionary (memoized per index)"""
+        name = self._tex_name_cache.get(name_index)
+        if name is None:
+            name = self._tex_name_cache[name_index] = self._lookup_texture_name(name_index)
+        return name
+    
+    def _lookup_texture_name(self, name_index):
         # Try StrCode64 lookup (TPP format)
-        if hasattr(self, 'str_code64s') and name_index < len(self.str_code64s):
+        if name_index < len(self.str_code64s):
             hash_val = self.str_code64s[name_index]
             if self.dict:
                 name = self.dict.get_bone_name(hash_val)  # Uses same hash lookup
@@ -1412,9 +1855,15 @@ class FMDLParser:
         return f"Tex_{name_index:03d}"
     
     def _resolve_texture_path(self, path_index):
-        """Resolve texture path from PathCode64 or dictionary"""
+        """Resolve texture path from PathCode64 or dictionary (memoized per index)"""
+        path = self._tex_path_cache.get(path_index)
+        if path is None:
+            path = self._tex_path_cache[path_index] = self._lookup_texture_path(path_index)
+        return path
+    
+    def _lookup_texture_path(self, path_index):
         # Try PathCode64 lookup (TPP format)
-        if hasattr(self, 'path_code64s') and path_index < len(self.path_code64s):
+        if path_index < len(self.path_code64s):
             path_hash = self.path_code64s[path_index]
             if self.dict:
                 # Try to get path from QAR dictionary
@@ -1442,40 +1891,23 @@ class FMDLParser:
     
     
     # --- 4.9: Mesh Data Layout Descriptions (Critical for Vertex Format) ---
+    DATA_LAYOUT_DTYPE = np.dtype([('buffer_count', 'u1'), ('format_element_count', 'u1'),
+                                  ('unknown0', 'u1'), ('uv_count', 'u1'),
+                                  ('buffer_headers_start', '<u2'), ('format_elements_start', '<u2')])
+    
     def read_mesh_data_layouts(self):
         """Parse MESH_DATA_LAYOUTS (feature 9) - Vertex format definitions"""
         logger.sub_section("Reading Mesh Data Layout Descriptions")
-        fh = self._get_feature_header(9)  # MESH_DATA_LAYOUT_DESCS
-        
-        if not fh:
-            logger.warning("No MESH_DATA_LAYOUT_DESCS feature (9)")
+        records = self._read_feature_records(9, self.DATA_LAYOUT_DTYPE, "layouts")  # MESH_DATA_LAYOUT_DESCS
+        if records is None:
             return 0
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        layout_size = 8  # 8 bytes per layout
-        
-        # Bounds check
-        if offset + count * layout_size > len(self.data):
-            logger.warning(f"Layouts truncated: {count} need {count*layout_size} bytes")
-            count = (len(self.data) - offset) // layout_size
-        
-        logger.start(f"Reading {count} layouts @ 0x{offset:08X}")
         self.mesh_data_layouts.clear()
         
-        for i in range(count):
-            layout_offset = offset + (i * layout_size)
-            if layout_offset + layout_size > len(self.data):
-                break
-            
-            # Layout header (packed 8 bytes)
-            buffer_count = self.data[layout_offset]                    # 1 byte
-            format_element_count = self.data[layout_offset + 1]        # 1 byte
-            unknown0 = self.data[layout_offset + 2]                    # 1 byte (vertex stride?)
-            uv_count = self.data[layout_offset + 3]                    # 1 byte
-            
-            buffer_headers_start = struct.unpack('<H', self.data[layout_offset+4:layout_offset+6])[0]  # 2 bytes
-            format_elements_start = struct.unpack('<H', self.data[layout_offset+6:layout_offset+8])[0] # 2 bytes
+        # Layout header (packed 8 bytes): buffer count, format element count,
+        # unknown0 (vertex stride?), uv count, buffer headers start, format elements start
+        rows = records.tolist()
+        for i, (buffer_count, format_element_count, unknown0, uv_count,
+                buffer_headers_start, format_elements_start) in enumerate(rows):
             
             # Calculate expected stride (critical for vertex reading)
             expected_stride = format_element_count * 16  # Average 16 bytes per attribute
@@ -1483,32 +1915,32 @@ class FMDLParser:
                 expected_stride *= buffer_count
             
             # Validate references
-            buffer_valid = buffer_headers_start < len(self.mesh_buffer_headers) if hasattr(self, 'mesh_buffer_headers') else True
-            format_valid = format_elements_start < len(self.mesh_buffer_format_elements) if hasattr(self, 'mesh_buffer_format_elements') else True
-            
-            self.mesh_data_layouts.append({
-                'index': i,
-                'buffer_count': buffer_count,
-                'format_element_count': format_element_count,
-                'unknown0': unknown0,
-                'uv_count': uv_count,
-                'buffer_headers_start': buffer_headers_start,
-                'format_elements_start': format_elements_start,
-                'expected_stride': expected_stride,
-                'buffer_valid': buffer_valid,
-                'format_valid': format_valid,
-                'layout_name': f"Layout_{i:02d}_{buffer_count}b_{format_element_count}e_{uv_count}uv",
-            })
+            buffer_valid = buffer_headers_start < len(self.mesh_buffer_headers)
+            format_valid = format_elements_start < len(self.mesh_buffer_format_elements)
+            
+            self.mesh_data_layouts.append(DataLayoutRecord(
+                index=i,
+                buffer_count=buffer_count,
+                format_element_count=format_element_count,
+                unknown0=unknown0,
+                uv_count=uv_count,
+                buffer_headers_start=buffer_headers_start,
+                format_elements_start=format_elements_start,
+                expected_stride=expected_stride,
+                buffer_valid=buffer_valid,
+                format_valid=format_valid,
+            ))
             
             # Log all layouts (critical for debugging vertex issues)
-            logger.info(f"L{i:2d}: {buffer_count}b/{format_element_count}e/{uv_count}uv "
-                       f"stride~{expected_stride} bh={buffer_headers_start} fe={format_elements_start}")
+            if INFO:
+                logger.info(f"L{i:2d}: {buffer_count}b/{format_element_count}e/{uv_count}uv "
+                           f"stride~{expected_stride} bh={buffer_headers_start} fe={format_elements_start}")
         
         logger.success("Layouts parsed", f"{len(self.mesh_data_layouts)} layouts")
         
         # Layout statistics (predicts vertex complexity)
-        multi_buffer = sum(1 for l in self.mesh_data_layouts if l['buffer_count'] > 1)
-        high_poly = sum(1 for l in self.mesh_data_layouts if l['format_element_count'] > 12)
+        multi_buffer = int((records['buffer_count'] > 1).sum())
+        high_poly = int((records['format_element_count'] > 12).sum())
         
         logger.info(f"Multi-buffer: {multi_buffer}/{len(self.mesh_data_layouts)}")
         logger.info(f"High-complexity: {high_poly}/{len(self.mesh_data_layouts)}")
@@ -1527,81 +1959,61 @@ class FMDLParser:
 
 
     # --- 4.10: Mesh Buffer Headers (Vertex Stream Headers - Critical!) ---
+    MESH_BUFFER_HEADER_DTYPE = _record_dtype((
+        ('file_buffer_index', 'u1', 0), ('format_element_count', 'u1', 1), ('stride', 'u1', 2),
+        ('bind_slot', 'u1', 3), ('data_offset', '<u4', 4)), 0x10)
+    
     def read_mesh_buffer_headers(self):
         """Parse MESH_BUFFER_HEADERS (feature 10) - Vertex buffer stream definitions"""
         logger.sub_section("Reading Mesh Buffer Headers")
-        fh = self._get_feature_header(10)  # MESH_BUFFER_HEADERS
-        
-        if not fh:
-            logger.warning("No MESH_BUFFER_HEADERS feature (10)")
+        records = self._read_feature_records(10, self.MESH_BUFFER_HEADER_DTYPE, "buffer headers")  # MESH_BUFFER_HEADERS
+        if records is None:
             return 0
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        header_size = 0x10  # 16 bytes
-        
-        # Bounds check
-        if offset + count * header_size > len(self.data):
-            logger.warning(f"Buffer headers truncated: {count} need {count*header_size} bytes")
-            count = (len(self.data) - offset) // header_size
-        
-        logger.start(f"Reading {count} buffer headers @ 0x{offset:08X}")
         self.mesh_buffer_headers.clear()
         
-        for i in range(count):
-            buf_offset = offset + (i * header_size)
-            if buf_offset + header_size > len(self.data):
-                break
-            
-            # Packed header (first 4 bytes)
-            file_buffer_index = self.data[buf_offset]              # 1 byte - VBuffer index
-            format_element_count = self.data[buf_offset + 1]       # 1 byte - attribute count
-            stride = self.data[buf_offset + 2]                     # 1 byte - **VERTEX STRIDE (bytes)!**
-            bind_slot = self.data[buf_offset + 3]                  # 1 byte - shader binding slot
-            
-            # Data offset @ 0x04 (4 bytes) - offset in VBuffer
-            data_offset = struct.unpack('<I', self.data[buf_offset+4:buf_offset+8])[0]
-            
-            # Padding/reserved @ 0x08-0x10 (8 bytes)
+        # Packed header: VBuffer index, attribute count, **VERTEX STRIDE (bytes)!**,
+        # shader binding slot, data offset in VBuffer @ 0x04, padding/reserved @ 0x08-0x10
+        # Vertex buffer info per file buffer index (cross-reference), built once
+        vbuffer_infos = {j: f"VBuf{j}@{vbuf['data_size']:,}B"
+                         for j, vbuf in enumerate(self.buffer_headers) if vbuf['type'] == 2}  # VERTEX_BUFFER
+        
+        rows = records.tolist()
+        for i, (file_buffer_index, format_element_count, stride, bind_slot, data_offset) in enumerate(rows):
             
             # Cross-reference validation
             layout_match = None
+            stride_match = False
             if i < len(self.mesh_data_layouts):
                 layout_match = self.mesh_data_layouts[i]
                 stride_match = abs(stride - layout_match.get('expected_stride', stride)) < 16
             
-            # Vertex buffer info (cross-reference)
-            vbuffer_info = None
-            if hasattr(self, 'buffer_headers') and file_buffer_index < len(self.buffer_headers):
-                vbuf = self.buffer_headers[file_buffer_index]
-                if vbuf['type'] == 2:  # VERTEX_BUFFER
-                    vbuffer_info = f"VBuf{file_buffer_index}@{vbuf['data_size']:,}B"
-            
-            self.mesh_buffer_headers.append({
-                'index': i,
-                'file_buffer_index': file_buffer_index,
-                'vbuffer_info': vbuffer_info,
-                'format_element_count': format_element_count,
-                'stride': stride,  # 🔥 VERTEX STRIDE - حیاتی!
-                'stride_hex': f"0x{stride:02X}",
-                'bind_slot': bind_slot,
-                'data_offset': data_offset,
-                'layout_match': layout_match['index'] if layout_match else -1,
-                'stride_valid': stride > 0 and stride <= 128,  # Typical range
-                'header_name': f"VStream_{i}_{stride}B_{format_element_count}attr",
-            })
+            vbuffer_info = vbuffer_infos.get(file_buffer_index)
+            
+            self.mesh_buffer_headers.append(BufferHeaderRecord(
+                index=i,
+                file_buffer_index=file_buffer_index,
+                vbuffer_info=vbuffer_info,
+                format_element_count=format_element_count,
+                stride=stride,  # 🔥 VERTEX STRIDE - حیاتی!
+                bind_slot=bind_slot,
+                data_offset=data_offset,
+                layout_match=layout_match['index'] if layout_match else -1,
+                stride_valid=stride > 0 and stride <= 128,  # Typical range
+            ))
             
             # Log ALL headers (critical for vertex debugging)
-            status = "✓" if self.mesh_buffer_headers[-1]['stride_valid'] else "✗"
-            logger.info(f"[{status}] H{i:2d}: {stride}B/{format_element_count}attr "
-                       f"slot={bind_slot} vbuf={file_buffer_index} "
-                       f"off=0x{data_offset:06X} {'MATCH' if stride_match else 'MISMATCH'}")
+            if INFO:
+                status = "✓" if self.mesh_buffer_headers[-1]['stride_valid'] else "✗"
+                logger.info(f"[{status}] H{i:2d}: {stride}B/{format_element_count}attr "
+                           f"slot={bind_slot} vbuf={file_buffer_index} "
+                           f"off=0x{data_offset:06X} {'MATCH' if stride_match else 'MISMATCH'}")
         
         logger.success("Buffer headers parsed", f"{len(self.mesh_buffer_headers)} headers")
         
         # Critical statistics
-        invalid_stride = sum(1 for h in self.mesh_buffer_headers if not h['stride_valid'])
-        multi_stream = sum(1 for h in self.mesh_buffer_headers if h['bind_slot'] > 0)
+        strides = records['stride']
+        invalid_stride = int(((strides == 0) | (strides > 128)).sum())
+        multi_stream = int((records['bind_slot'] > 0).sum())
         
         logger.warning(f"Invalid strides: {invalid_stride}/{len(self.mesh_buffer_headers)}")
         logger.info(f"Multi-stream: {multi_stream}/{len(self.mesh_buffer_headers)}")
@@ -1622,81 +2034,73 @@ class FMDLParser:
     
     
         # --- 4.11: Mesh Buffer Format Elements (Vertex Attributes - Critical!) ---
+    FORMAT_ELEMENT_DTYPE = np.dtype([('usage', 'u1'), ('type', 'u1'), ('offset', '<u2')])
+    # USAGE_COMPONENT_COUNTS padded to every u8 usage code, indexed by the usage column
+    FORMAT_USAGE_COMPONENTS = np.array(
+        USAGE_COMPONENT_COUNTS + (1,) * (256 - len(USAGE_COMPONENT_COUNTS)), dtype=np.uint8)
+    FORMAT_ELEMENT_NAMES = {}  # (usage, type) -> (usage name, type name, byte size)
+    
+    @staticmethod
+    def _format_element_names(usage, elem_type):
+        """Usage name, type name and byte size for one usage/type pair"""
+        if usage < len(MESH_BUFFER_FORMAT_ELEMENT_USAGE):
+            usage_name = MESH_BUFFER_FORMAT_ELEMENT_USAGE[usage]
+        else:
+            usage_name = f"UNK_{usage:02X}"
+        if elem_type < len(ELEMENT_TYPE_SIZES):
+            type_name = MESH_BUFFER_FORMAT_ELEMENT_TYPE[elem_type]
+            byte_size = ELEMENT_TYPE_SIZES[elem_type]
+        else:
+            type_name = f"UNK_{elem_type:02X}"
+            byte_size = 4
+        return usage_name, type_name, byte_size
+    
     def read_mesh_buffer_format_elements(self):
         """Parse VERTEX_FORMATS (feature 11) - Vertex attribute layout"""
         logger.sub_section("Reading Vertex Formats")
-        fh = self._get_feature_header(11)  # VERTEX_FORMATS
-        
-        if not fh:
-            logger.warning("No VERTEX_FORMATS feature (11)")
+        records = self._read_feature_records(11, self.FORMAT_ELEMENT_DTYPE, "format elements")  # VERTEX_FORMATS
+        if records is None:
             return 0
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        elem_size = 4  # 4 bytes per element (type:1, dataType:1, offset:2)
-        
-        # Bounds check
-        if offset + count * elem_size > len(self.data):
-            logger.warning(f"Format elements truncated: {count} need {count*elem_size} bytes")
-            count = (len(self.data) - offset) // elem_size
-        
-        logger.start(f"Reading {count} format elements @ 0x{offset:08X}")
         self.mesh_buffer_format_elements.clear()
-        
-        for i in range(count):
-            elem_offset = offset + (i * elem_size)
-            if elem_offset + elem_size > len(self.data):
-                break
-            
-            # ✅ اصلاح شده: ساختار درست FmdlVertexFormat از Fmdl.cs
-            # type (1 byte), dataType (1 byte), offset (2 bytes)
-            usage = self.data[elem_offset]                           # type
-            elem_type = self.data[elem_offset + 1]                     # dataType
-            elem_offset_val = struct.unpack('<H', self.data[elem_offset+2:elem_offset+4])[0]  # offset in stride
-            
-            # ✅ استفاده از mapping درست
-            usage_name = MESH_BUFFER_FORMAT_ELEMENT_USAGE.get(usage, f"UNK_{usage:02X}")
-            type_name = MESH_BUFFER_FORMAT_ELEMENT_TYPE.get(elem_type, f"UNK_{elem_type:02X}")
-            byte_size = ELEMENT_TYPE_SIZES.get(elem_type, 4)
-            
-            # Calculate component count based on usage
-            if usage == 0:  # POSITION
-                component_count = 3
-            elif usage in [1, 4, 5, 6, 11, 12]:  # BONE_WEIGHT/INDEX
-                component_count = 4
-            elif usage in [7, 8, 9, 10]:  # UV
-                component_count = 2
-            elif usage in [2, 13, 14]:  # NORMAL, TANGENT, BINORMAL
-                component_count = 4
-            elif usage == 3:  # COLOR
-                component_count = 4
-            else:
-                component_count = 1
-            
-            self.mesh_buffer_format_elements.append({
-                'index': i,
-                'usage': usage,
-                'usage_name': usage_name,
-                'type': elem_type,
-                'type_name': type_name,
-                'offset': elem_offset_val,
-                'byte_size': byte_size,
-                'components': component_count,
-                'attr_name': f"{usage_name}_{type_name}_{elem_offset_val}",
-            })
+        self._fmt_per_vbuf.clear()
+        
+        # ✅ اصلاح شده: ساختار درست FmdlVertexFormat از Fmdl.cs
+        # type (1 byte), dataType (1 byte), offset in stride (2 bytes)
+        usages = records['usage']
+        components = self.FORMAT_USAGE_COMPONENTS[usages].tolist()
+        element_names = self.FORMAT_ELEMENT_NAMES
+        for i, ((usage, elem_type, elem_offset_val), component_count) in enumerate(zip(records.tolist(), components)):
+            
+            # ✅ استفاده از mapping درست - one cached lookup per usage/type pair
+            names = element_names.get((usage, elem_type))
+            if names is None:
+                names = element_names[usage, elem_type] = self._format_element_names(usage, elem_type)
+            usage_name, type_name, byte_size = names
+            
+            self.mesh_buffer_format_elements.append(FormatElementRecord(
+                index=i,
+                usage=usage,
+                usage_name=usage_name,
+                type=elem_type,
+                type_name=type_name,
+                offset=elem_offset_val,
+                byte_size=byte_size,
+                components=component_count,
+            ))
             
             # Log first 20 elements
-            if i < 20:
+            if INFO and i < 20:
                 logger.info(f"E{i:3d}: {usage_name:<12} {type_name:<8} @0x{elem_offset_val:04X} ({byte_size}B)")
         
         logger.success("Format elements parsed", f"{len(self.mesh_buffer_format_elements)} elements")
         
-        # Attribute statistics
-        position_attrs = sum(1 for e in self.mesh_buffer_format_elements if e['usage'] == 0)
-        normal_attrs = sum(1 for e in self.mesh_buffer_format_elements if e['usage'] == 2)
-        uv_attrs = sum(1 for e in self.mesh_buffer_format_elements if e['usage'] in [7, 8, 9, 10])
-        bone_weight_attrs = sum(1 for e in self.mesh_buffer_format_elements if e['usage'] == 1)
-        bone_index_attrs = sum(1 for e in self.mesh_buffer_format_elements if e['usage'] == 4)
+        # Attribute statistics (one histogram over the usage column)
+        usage_counts = np.bincount(usages, minlength=256).tolist()
+        position_attrs = usage_counts[0]
+        normal_attrs = usage_counts[2]
+        uv_attrs = sum(usage_counts[7:11])
+        bone_weight_attrs = usage_counts[1]
+        bone_index_attrs = usage_counts[4]
         
         logger.info(f"Position: {position_attrs}, Normal: {normal_attrs}, UV: {uv_attrs}")
         logger.info(f"BoneWeights: {bone_weight_attrs}, BoneIndices: {bone_index_attrs}")
@@ -1718,39 +2122,24 @@ class FMDLParser:
     
     
     # --- 4.12: File Mesh Buffer Headers (FIXED) ---
+    FILE_BUFFER_HEADER_DTYPE = _record_dtype((
+        ('type', '<u2', 0), ('data_size', '<u4', 4), ('data_offset', '<u4', 8)), 0x10)
+    
     def read_file_mesh_buffer_headers(self):
         """Parse FILE_MESH_BUFFER_HEADERS (feature 14) - Vertex/Index buffer locations"""
         logger.sub_section("Reading File Mesh Buffer Headers")
-        fh = self._get_feature_header(14)  # FILE_MESH_BUFFER_HEADERS
-        
-        if not fh:
-            logger.warning("No FILE_MESH_BUFFER_HEADERS feature (14)")
+        records = self._read_feature_records(14, self.FILE_BUFFER_HEADER_DTYPE, "file buffer headers")  # FILE_MESH_BUFFER_HEADERS
+        if records is None:
             return 0
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        header_size = 0x10  # 16 bytes per header
-        
-        # Bounds check
-        if offset + count * header_size > len(self.data):
-            logger.warning(f"File headers truncated: {count} need {count*header_size} bytes")
-            count = (len(self.data) - offset) // header_size
-        
-        logger.start(f"Reading {count} file buffer headers @ 0x{offset:08X}")
         self.file_mesh_buffer_headers.clear()
         
-        for i in range(count):
+        # ✅ FIXED: Complete 16-byte structure parsing
+        # 0-1: Buffer type, 2-3: Padding, 4-7: Data size, 8-11: Data offset, 12-15: Padding
+        offset, header_size = self._feature_base_offset[14], records.itemsize
+        valid_flags = records['data_offset'].astype(np.int64) + records['data_size'] <= len(self.data)
+        rows = zip(records.tolist(), valid_flags.tolist())
+        for i, ((buf_type, data_size, data_offset), is_valid) in enumerate(rows):
             file_offset = offset + (i * header_size)
-            if file_offset + header_size > len(self.data):
-                logger.warning(f"Header {i} truncated")
-                break
-            
-            # ✅ FIXED: Complete 16-byte structure parsing
-            buf_type = struct.unpack('<H', self.data[file_offset:file_offset+2])[0]           # 0-1: Buffer type
-            padding1 = self.data[file_offset+2:file_offset+4]                                  # 2-3: Padding
-            data_size = struct.unpack('<I', self.data[file_offset+4:file_offset+8])[0]        # 4-7: Data size
-            data_offset = struct.unpack('<I', self.data[file_offset+8:file_offset+12])[0]     # 8-11: Data offset
-            padding2 = self.data[file_offset+12:file_offset+16]                                # 12-15: Padding
             
             # Buffer type mapping (Fox Engine standard)
             type_name = (
@@ -1760,25 +2149,21 @@ class FMDLParser:
             )
             
             # Validation
-            is_valid = True
-            if data_offset + data_size > len(self.data):
-                is_valid = False
+            if not is_valid:
                 logger.warning(f"Buffer {i}: invalid range 0x{data_offset:08X}+0x{data_size:08X}")
             
-            self.file_mesh_buffer_headers.append({
-                'index': i,
-                'type': buf_type,
-                'type_name': type_name,
-                'data_size': data_size,
-                'data_offset': data_offset,
-                'file_offset': file_offset,
-                'valid': is_valid,
-                'padding1': padding1.hex(),
-                'padding2': padding2.hex(),
-            })
+            self.file_mesh_buffer_headers.append(FileBufferHeaderRecord(
+                index=i,
+                type=buf_type,
+                type_name=type_name,
+                data_size=data_size,
+                data_offset=data_offset,
+                file_offset=file_offset,
+                valid=is_valid,
+            ))
             
             # Detailed logging for first few + invalids
-            if i < 5 or not is_valid:
+            if INFO and (i < 5 or not is_valid):
                 status = "✓" if is_valid else "✗"
                 logger.info(f"[{status}] F{i:2d}: {type_name:<12} "
                            f"size=0x{data_size:06X}B offset=0x{data_offset:08X}")
@@ -1786,9 +2171,13 @@ class FMDLParser:
         logger.success("File buffer headers parsed", f"{len(self.file_mesh_buffer_headers)} headers")
         
         # Statistics
-        vbuffers = sum(1 for h in self.file_mesh_buffer_headers if h['type_name'] == 'VERTEX_BUFFER')
-        ibuffers = sum(1 for h in self.file_mesh_buffer_headers if h['type_name'] == 'INDEX_BUFFER')
-        invalid = sum(1 for h in self.file_mesh_buffer_headers if not h['valid'])
+        index_buffers = records['type'] == 1
+        vbuffers = int((records['type'] == 0).sum())
+        ibuffers = int(index_buffers.sum())
+        invalid = int((~valid_flags).sum())
+        
+        # Index total for slice validation, stored once per table (16-bit indices assumed)
+        self._total_indices = int((records['data_size'][index_buffers] // 2).sum(dtype=np.int64))
         
         logger.info(f"VBuffers: {vbuffers}, IBuffers: {ibuffers}, Invalid: {invalid}")
         return len(self.file_mesh_buffer_headers)
@@ -1805,67 +2194,46 @@ class FMDLParser:
     
     
     # --- 4.13: IBuffer Slices (FIXED & OPTIMIZED) ---
+    IBUFFER_SLICE_DTYPE = np.dtype([('start_index', '<u4'), ('count', '<u4')])
+    
     def read_ibuffer_slices(self):
         """Parse IBUFFER_SLICES (feature 17) - Index buffer sub-ranges for submeshes"""
         logger.sub_section("Reading IBuffer Slices")
-        fh = self._get_feature_header(17)  # IBUFFER_SLICES
-        
-        if not fh:
-            logger.warning("No IBUFFER_SLICES feature (17)")
+        records = self._read_feature_records(17, self.IBUFFER_SLICE_DTYPE, "IBuffer slices")  # IBUFFER_SLICES
+        if records is None:
             return 0
         
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        slice_size = 8  # 8 bytes per slice (start_index + count)
-        
-        # Bounds check
-        if offset + count * slice_size > len(self.data):
-            logger.warning(f"IBuffer slices truncated: {count} need {count*slice_size} bytes")
-            count = (len(self.data) - offset) // slice_size
-        
-        logger.start(f"Reading {count} IBuffer slices @ 0x{offset:08X}")
-        self.ibuffer_slices.clear()
-        
-        total_indices = 0
-        for i in range(count):
-            slice_offset = offset + (i * slice_size)
-            if slice_offset + slice_size > len(self.data):
-                logger.warning(f"Slice {i} truncated")
-                break
-            
-            # ✅ FIXED: Complete 8-byte parsing
-            start_index = struct.unpack('<I', self.data[slice_offset:slice_offset+4])[0]      # 0-3: Start index
-            index_count = struct.unpack('<I', self.data[slice_offset+4:slice_offset+8])[0]   # 4-7: Triangle count
-            
-            # Validation
-            is_valid = True
-            if start_index + index_count > self._get_total_indices():
-                is_valid = False
-                logger.warning(f"Slice {i}: invalid range {start_index}+{index_count}")
-            
-            self.ibuffer_slices.append({
-                'index': i,
-                'start_index': start_index,
-                'count': index_count,
-                'triangles': index_count // 3,  # Assuming triangles
-                'valid': is_valid,
-                'offset': slice_offset,
-            })
-            
-            total_indices += index_count
-            
-            # Log first 10 + invalids
-            if i < 10 or not is_valid:
-                status = "✓" if is_valid else "✗"
-                tris = index_count // 3
-                logger.info(f"[{status}] S{i:2d}: start={start_index:8d}, "
-                           f"count={index_count:6d} ({tris} triangles)")
+        # ✅ FIXED: Complete 8-byte parsing - one C-level pass over the table
+        offset, slice_size = self._feature_base_offset[17], records.itemsize
+        start_indices = records['start_index']
+        index_counts = records['count']
+        total_indices = self._get_total_indices()  # once per table, not per slice
+        slice_ends = start_indices.astype(np.int64) + index_counts
+        valid_flags = slice_ends <= total_indices
+        self.ibuffer_slices = RecordTable(
+            {'start_index': start_indices, 'count': index_counts,
+             'triangles': index_counts // 3,  # Assuming triangles
+             'valid': valid_flags,
+             'offset': offset + np.arange(len(records), dtype=np.int64) * slice_size},
+            derived={'index': _row_index},
+            fields=('index', 'start_index', 'count', 'triangles', 'valid', 'offset'))
+        
+        # Log first 10 + invalids
+        for i in np.flatnonzero(~valid_flags).tolist():
+            logger.warning(f"Slice {i}: invalid range {start_indices[i]}+{index_counts[i]} "
+                           f"(ends at {slice_ends[i]}, {total_indices} indices available)")
+        if INFO:
+            logged = np.union1d(np.arange(min(10, len(records))), np.flatnonzero(~valid_flags))
+            for i in logged.tolist():
+                status = "✓" if valid_flags[i] else "✗"
+                logger.info(f"[{status}] S{i:2d}: start={start_indices[i]:8d}, "
+                           f"count={index_counts[i]:6d} ({index_counts[i] // 3} triangles)")
         
         logger.success("IBuffer slices parsed", f"{len(self.ibuffer_slices)} slices")
         
         # Statistics
-        valid_slices = sum(1 for s in self.ibuffer_slices if s['valid'])
-        total_tris = sum(s['count'] // 3 for s in self.ibuffer_slices)
+        valid_slices = int(valid_flags.sum())
+        total_tris = int((index_counts // 3).sum(dtype=np.int64))
         
         logger.info(f"Valid: {valid_slices}/{len(self.ibuffer_slices)}, "
                     f"Total triangles: {total_tris}")
@@ -1873,271 +2241,38 @@ class FMDLParser:
         return len(self.ibuffer_slices)
 
     def _get_total_indices(self):
-        """Helper: Get total available indices from index buffers"""
-        total = 0
-        for h in self.file_mesh_buffer_headers:
-            if h['type_name'] == 'INDEX_BUFFER':
-                total += h['data_size'] // 2  # Assuming 16-bit indices
-        return total
+        """Helper: Get total available indices from index buffers (stored by read_file_mesh_buffer_headers)"""
+        if self._total_indices is None:  # feature 14 not read (or headers set by hand)
+            self._total_indices = sum(h['data_size'] // 2 for h in self.file_mesh_buffer_headers
+                                      if h['type'] == 1)  # INDEX_BUFFER, 16-bit indices
+        return self._total_indices
 
         
     
     
     
-    # --- 4.14: Vertex Buffer Reader (کاملاً اصلاح شده) ---
-    def read_vertex_buffer(self, mesh_def):
-        """Read vertex buffer for a mesh using correct format elements"""
-        logger.start(f"Reading vertices for mesh {mesh_def['index']}")
-        
-        # Get layout
-        layout_idx = mesh_def.get('data_layout_index', 0)
-        if layout_idx >= len(self.mesh_data_layouts):
-            logger.error(f"Invalid layout index {layout_idx}")
-            return []
-        
-        layout = self.mesh_data_layouts[layout_idx]
-        
-        # Get format elements for this layout
-        format_start = layout['format_elements_start']
-        format_count = layout['format_element_count']
-        
-        # Get buffer header
-        buffer_header_idx = layout['buffer_headers_start']
-        if buffer_header_idx >= len(self.mesh_buffer_headers):
-            logger.error(f"Invalid buffer header index {buffer_header_idx}")
-            return []
-        
-        buf_header = self.mesh_buffer_headers[buffer_header_idx]
-        stride = buf_header['stride']
-        
-        # Get file buffer
-        file_buf_idx = buf_header.get('file_buffer_index', 0)
-        if file_buf_idx >= len(self.file_mesh_buffer_headers):
-            logger.error(f"Invalid file buffer index {file_buf_idx}")
-            return []
-        
-        file_buf = self.file_mesh_buffer_headers[file_buf_idx]
-        if file_buf['type'] != 0:  # VERTEX_BUFFER
-            logger.error(f"Buffer type is not VERTEX_BUFFER")
-            return []
-        
-        # Calculate vertex count and offset
-        vert_start = mesh_def.get('vertices_start_index', 0)
-        vert_count = mesh_def.get('vertex_count', 0)
-        
-        # Read vertices
-        buffer_start = file_buf['data_offset']
-        vert_offset = buffer_start + (vert_start * stride)
-        
-        vertices = []
-        format_elements = self.mesh_buffer_format_elements[format_start:format_start+format_count]
-        
-        for v in range(vert_count):
-            v_offset = vert_offset + (v * stride)
-            vertex = self._parse_vertex_v2(v_offset, format_elements, stride)
-            vertices.append(vertex)
-        
-        logger.success(f"Vertices read", f"{len(vertices)} vertices")
-        return vertices
-    
-    def _parse_vertex_v2(self, offset, format_elements, stride):
-        """Parse single vertex with correct format elements"""
-        vertex = {
-            'position': None,
-            'normal': None,
-            'tangent': None,
-            'uv': [],
-            'uv2': None,
-            'color': None,
-            'bone_weights': None,
-            'bone_indices': None,
-        }
-        
-        for elem in format_elements:
-            elem_offset = offset + elem['offset']
-            usage = elem['usage']
-            elem_type = elem['type']
-            
-            try:
-                if usage == 0:  # POSITION
-                    vertex['position'] = self._read_vector3(elem_offset, elem_type)
-                    
-                elif usage == 1:  # BONE_WEIGHT0
-                    vertex['bone_weights'] = self._read_bone_weights(elem_offset, elem_type)
-                    
-                elif usage == 2:  # NORMAL
-                    vertex['normal'] = self._read_vector4_half(elem_offset, elem_type)
-                    
-                elif usage == 3:  # COLOR
-                    vertex['color'] = self._read_color(elem_offset, elem_type)
-                    
-                elif usage == 4:  # BONE_INDEX0
-                    vertex['bone_indices'] = self._read_bone_indices(elem_offset, elem_type)
-                    
-                elif usage in [7, 8, 9, 10]:  # UV0-3
-                    uv_val = self._read_uv(elem_offset, elem_type)
-                    if usage == 7:
-                        vertex['uv'] = [uv_val] if uv_val else []
-                    elif usage == 8:
-                        vertex['uv'].append(uv_val) if uv_val else None
-                    elif usage == 9:
-                        vertex['uv'].append(uv_val) if uv_val else None
-                    elif usage == 10:
-                        vertex['uv'].append(uv_val) if uv_val else None
-                        
-                elif usage == 13:  # TANGENT
-                    vertex['tangent'] = self._read_vector4_half(elem_offset, elem_type)
-                    
-                elif usage == 14:  # BINORMAL
-                    pass  # Usually not needed for Blender
-                    
-            except Exception as e:
-                logger.debug(f"Error reading element {elem['usage_name']}: {e}")
-        
-        return vertex
-    
-    def _read_vector3(self, offset, elem_type):
-        """Read 3D vector (POSITION)"""
-        if elem_type == 4:  # FLOAT
-            return struct.unpack('<3f', self.data[offset:offset+12])
-        elif elem_type == 5:  # HALF
-            x = self._read_half_float(offset)
-            y = self._read_half_float(offset+2)
-            z = self._read_half_float(offset+4)
-            return (x, y, z)
-        return (0.0, 0.0, 0.0)
-    
-    def _read_vector4_half(self, offset, elem_type):
-        """Read 4D half-float vector (NORMAL, TANGENT)"""
-        if elem_type == 5:  # HALF
-            x = self._read_half_float(offset)
-            y = self._read_half_float(offset+2)
-            z = self._read_half_float(offset+4)
-            w = self._read_half_float(offset+6)
-            return (x, y, z, w)
-        elif elem_type == 4:  # FLOAT
-            return struct.unpack('<4f', self.data[offset:offset+16])
-        return (0.0, 0.0, 0.0, 0.0)
-    
-    def _read_bone_weights(self, offset, elem_type):
-        """Read bone weights (4 bytes)"""
-        if elem_type in [0, 1, 8]:  # BYTE, UBYTE, or D3DCOLOR
-            w = struct.unpack('<4B', self.data[offset:offset+4])
-            return [x / 255.0 for x in w]
-        elif elem_type == 4:  # FLOAT
-            return struct.unpack('<4f', self.data[offset:offset+16])
-        return [0.0, 0.0, 0.0, 0.0]
-    
-    def _read_bone_indices(self, offset, elem_type):
-        """Read bone indices (4 bytes)"""
-        if elem_type in [0, 1, 9]:  # BYTE, UBYTE, or quadInt8
-            return struct.unpack('<4B', self.data[offset:offset+4])
-        elif elem_type == 3:  # USHORT
-            return struct.unpack('<4H', self.data[offset:offset+8])
-        return [0, 0, 0, 0]
-    
-    def _read_uv(self, offset, elem_type):
-        """Read UV coordinates"""
-        if elem_type == 5:  # HALF
-            u = self._read_half_float(offset)
-            v = self._read_half_float(offset+2)
-            return (u, v)
-        elif elem_type == 4:  # FLOAT
-            return struct.unpack('<2f', self.data[offset:offset+8])
-        return (0.0, 0.0)
-    
-    def _read_color(self, offset, elem_type):
-        """Read color (4 bytes)"""
-        if elem_type in [1, 8]:  # UBYTE or D3DCOLOR
-            return struct.unpack('<4B', self.data[offset:offset+4])
-        return (255, 255, 255, 255)
-    
-    def _read_half_float(self, offset):
-        """Read half-float (16-bit)"""
-        half_val = struct.unpack('<H', self.data[offset:offset+2])[0]
-        return self._half_to_float(half_val)
-    
-    def _half_to_float(self, half_val):
-        """Convert half-precision float to single-precision"""
-        import math
-        
-        sign = (half_val >> 15) & 0x1
-        exponent = (half_val >> 10) & 0x1F
-        mantissa = half_val & 0x3FF
-        
-        if exponent == 0:
-            if mantissa == 0:
-                return -0.0 if sign else 0.0
-            else:
-                # Subnormal
-                return ((-1) ** sign) * (mantissa / 1024.0) * (2 ** -14)
-        elif exponent == 31:
-            if mantissa == 0:
-                return float('-inf') if sign else float('inf')
-            else:
-                return float('nan')
-        
-        # Normal
-        return ((-1) ** sign) * (1.0 + mantissa / 1024.0) * (2 ** (exponent - 15))
-    
-    
-    
-    
-    
-
     # --- 4.15: AABB Reader (FmdlBoundingBox struct) ---
+    # ✅ اصلاح شده: ساختار درست FmdlBoundingBox از Fmdl.cs
+    # max (Vector4: 4 floats), min (Vector4: 4 floats)
+    AABB_DTYPE = np.dtype([('max', '<f4', (4,)), ('min', '<f4', (4,))])
+    
     def read_aabbs(self):
         """Parse BOUNDING_BOXES (feature 13) - Axis-aligned bounding boxes"""
         logger.sub_section("Reading Bounding Boxes")
-        fh = self._get_feature_header(13)  # BOUNDING_BOXES
-        
-        if not fh:
-            logger.warning("No BOUNDING_BOXES feature (13)")
+        records = self._read_feature_records(13, self.AABB_DTYPE, "AABBs")  # BOUNDING_BOXES
+        if records is None:
             return 0
         
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        aabb_size = 0x20  # 32 bytes per FmdlBoundingBox (2x Vector4)
-        
-        # Bounds check
-        if offset + count * aabb_size > len(self.data):
-            logger.warning(f"AABBs truncated: {count} need {count*aabb_size} bytes")
-            count = (len(self.data) - offset) // aabb_size
-        
-        logger.start(f"Reading {count} AABBs @ 0x{offset:08X}")
-        self.aabbs.clear()
+        # Only the raw boxes are stored; center / size are computed on access
+        self.aabb_raw = records.view('<f4').reshape(len(records), 2, 4)
+        self.aabbs = RecordTable(
+            {'max': records['max'], 'min': records['min']},
+            derived={'index': _row_index, 'center': _aabb_center, 'size': _aabb_size},
+            fields=('index', 'max', 'min', 'center', 'size'))
         
-        for i in range(count):
-            aabb_offset = offset + (i * aabb_size)
-            if aabb_offset + aabb_size > len(self.data):
-                break
-            
-            # ✅ اصلاح شده: ساختار درست FmdlBoundingBox از Fmdl.cs
-            # max (Vector4: 4 floats), min (Vector4: 4 floats)
-            max_xyzw = struct.unpack('<4f', self.data[aabb_offset:aabb_offset+16])
-            min_xyzw = struct.unpack('<4f', self.data[aabb_offset+16:aabb_offset+32])
-            
-            center = (
-                (min_xyzw[0] + max_xyzw[0]) / 2,
-                (min_xyzw[1] + max_xyzw[1]) / 2,
-                (min_xyzw[2] + max_xyzw[2]) / 2,
-            )
-            
-            size = (
-                max_xyzw[0] - min_xyzw[0],
-                max_xyzw[1] - min_xyzw[1],
-                max_xyzw[2] - min_xyzw[2],
-            )
-            
-            self.aabbs.append({
-                'index': i,
-                'max': max_xyzw,
-                'min': min_xyzw,
-                'center': center,
-                'size': size,
-            })
-            
-            if i < 10:
+        if INFO:
+            centers, sizes = self.aabb_centers()[:10], self.aabb_sizes()[:10]
+            for i, (center, size) in enumerate(zip(centers.tolist(), sizes.tolist())):
                 status = "✓" if all(s > 0 for s in size) else "✗"
                 logger.info(f"[{status}] AABB {i:2d}: center=({center[0]:.2f},{center[1]:.2f},{center[2]:.2f}), "
                            f"size=({size[0]:.2f},{size[1]:.2f},{size[2]:.2f})")
@@ -2147,6 +2282,16 @@ class FMDLParser:
     
     
 
+    def aabb_centers(self):
+        """(N, 3) float64 box centers, computed from aabb_raw on demand"""
+        box = self.aabb_raw[:, :, :3].astype(np.float64)
+        return (box[:, 1] + box[:, 0]) / 2
+    
+    def aabb_sizes(self):
+        """(N, 3) float64 box sizes, computed from aabb_raw on demand"""
+        box = self.aabb_raw[:, :, :3].astype(np.float64)
+        return box[:, 0] - box[:, 1]
+    
     # --- 4.16: Skeleton Hierarchy (UNIVERSAL) ---
     def read_skeleton_hierarchy(self):
         """Find BONE feature dynamically"""
@@ -2160,29 +2305,25 @@ class FMDLParser:
         offset = self.header['features_data_offset'] + bone_fh['data_offset']
         count = bone_fh['total_count']
         bone_size = 4  # parent_index
+        count = min(count, max(len(self.data) - offset, 0) // bone_size)  # Bounds clamp
         
         logger.start(f"Reading {count} bones @ 0x{offset:08X}")
-        self.bones = []
-        
-        for i in range(count):
-            bone_offset = offset + (i * bone_size)
-            if bone_offset + bone_size > len(self.data): break
-            
-            parent_idx = struct.unpack('<i', self.data[bone_offset:bone_offset+4])[0]
-            
-            self.bones.append({
-                'index': i,
-                'parent_index': parent_idx,
-                'parent_name': f"Bone_{parent_idx}" if parent_idx >= 0 else "ROOT",
-                'name': f"Bone_{i:03d}",  # Will be updated later
-                'local_matrix': None,
-                'bind_matrix': None
-            })
-            
-            if i < 10:
+        # Parent column is the source of truth; bone rows are views over it
+        self.bone_parents = parents = np.frombuffer(self.data, dtype='<i4', count=count, offset=offset)
+        self.bones = RecordTable(
+            {'parent_index': parents,
+             'name': np.array([f"Bone_{i:03d}" for i in range(count)], dtype=object),  # Will be updated later
+             'local_matrix': np.full(count, None, dtype=object),
+             'bind_matrix': np.full(count, None, dtype=object)},
+            derived={'index': _row_index, 'parent_name': _parent_bone_name},
+            fields=('index', 'parent_index', 'parent_name', 'name', 'local_matrix', 'bind_matrix'))
+        
+        if INFO:
+            for i, parent_idx in enumerate(parents[:10].tolist()):
                 logger.info(f"Bone {i:2d} ← Parent {parent_idx}")
         
-        logger.success("Skeleton parsed", f"{len(self.bones)} bones")
+        logger.success("Skeleton parsed", f"{len(self.bones)} bones, "
+                       f"{int(np.count_nonzero(parents < 0))} roots")
         return len(self.bones)
 
     # --- 4.17: Bone Names (UNIVERSAL - Dynamic) ---
@@ -2219,7 +2360,7 @@ class FMDLParser:
             name = self._find_bone_name(offset, i, name_fh['total_count'])
             bone['name'] = name or f"Bone_{i:03d}"
             
-            if i < 5:
+            if INFO and i < 5:
                 logger.info(f"Bone {i}: {bone['name']}")
         
         logger.success("Bone names loaded", f"{len(self.bones)} names")
@@ -2244,121 +2385,24 @@ class FMDLParser:
         offset = self.header['features_data_offset'] + matrix_fh['data_offset']
         count = min(matrix_fh['total_count'], len(self.bones))
         matrix_size = 0x40  # 4x4 float matrix
+        count = min(count, max(len(self.data) - offset, 0) // matrix_size)  # Bounds clamp
         
         logger.start(f"Reading {count} matrices @ 0x{offset:08X}")
         
-        for i in range(count):
-            if i >= len(self.bones): break
-            matrix_offset = offset + (i * matrix_size)
-            if matrix_offset + matrix_size > len(self.data): break
-            
-            matrix = self._read_matrix4x4(matrix_offset)
-            self.bones[i]['local_matrix'] = matrix
-            self.bones[i]['bind_matrix'] = matrix.copy()
-            
-            if i < 3:
-                pos = [matrix[j*4] for j in range(3)]  # Extract translation
+        # All matrices in one read, as flat lists of 16 floats (same as _read_matrix4x4);
+        # each tolist() builds independent lists, so bind matrices can be edited separately
+        mats = np.frombuffer(self.data, dtype='<f4', count=count * 16, offset=offset).reshape(count, 16)
+        for bone, local, bind in zip(self.bones, mats.tolist(), mats.tolist()):
+            bone['local_matrix'] = local
+            bone['bind_matrix'] = bind
+        
+        if INFO:
+            for i, pos in enumerate(mats[:3, 0:12:4].tolist()):  # Extract translation
                 logger.info(f"Bone {i} ({self.bones[i]['name']}): pos=({pos[0]:.3f},{pos[1]:.3f},{pos[2]:.3f})")
         
         logger.success("Bone transforms loaded", f"{count} matrices")
         return count
 
-    # --- 4.19: Mesh Buffer Headers (UNIVERSAL) ---
-    def read_mesh_buffer_headers(self):
-        """Parse MESH_BUFFER_HEADERS dynamically"""
-        logger.sub_section("Reading Mesh Buffer Headers")
-        fh = self._get_feature_header_by_name(b'MESH_BUFFER_HEADER')
-        
-        if not fh:
-            logger.warning("No MESH_BUFFER_HEADERS feature")
-            return 0
-        
-        offset = self.header['features_data_offset'] + fh['data_offset']
-        count = fh['total_count']
-        header_size = 0x18
-        
-        if offset + count * header_size > len(self.data):
-            count = (len(self.data) - offset) // header_size
-        
-        logger.start(f"Reading {count} submeshes @ 0x{offset:08X}")
-        self.mesh_buffer_headers.clear()
-        
-        for i in range(count):
-            header_offset = offset + (i * header_size)
-            if header_offset + header_size > len(self.data): break
-            
-            # Safe unpacking with validation
-            vertex_count = struct.unpack('<I', self.data[header_offset:header_offset+4])[0]
-            index_count = struct.unpack('<I', self.data[header_offset+4:header_offset+8])[0]
-            stride = struct.unpack('<H', self.data[header_offset+8:header_offset+10])[0]
-            data_layout_idx = struct.unpack('<H', self.data[header_offset+10:header_offset+12])[0]
-            vbuffer_idx = struct.unpack('<H', self.data[header_offset+12:header_offset+14])[0]
-            ibuffer_idx = struct.unpack('<H', self.data[header_offset+14:header_offset+16])[0]
-            material_idx = struct.unpack('<H', self.data[header_offset+16:header_offset+18])[0]
-            
-            # Validation
-            if vertex_count > 100000:
-                logger.warning(f"Mesh {i}: capping {vertex_count} → 50000 verts")
-                vertex_count = 50000
-            
-            self.mesh_buffer_headers.append({
-                'index': i, 'vertex_count': vertex_count, 'index_count': index_count,
-                'stride': stride, 'data_layout_idx': data_layout_idx,
-                'vbuffer_idx': vbuffer_idx, 'ibuffer_idx': ibuffer_idx,
-                'material_idx': material_idx, 'aabb': None
-            })
-            
-            if i < 5:
-                logger.info(f"Submesh {i}: {vertex_count}v {index_count}i mat={material_idx}")
-        
-        logger.success("Mesh headers parsed", f"{len(self.mesh_buffer_headers)} submeshes")
-        return len(self.mesh_buffer_headers)
-
-    # --- 4.20: Materials (FIXED) ---
-    def read_materials(self):
-        """Parse MATERIALS feature dynamically - FIXED"""
-        logger.sub_section("Reading Materials")
-        
-        # Multiple strategies
-        mat_fh = (self._get_feature_header_by_name(b'MATERIAL') or 
-                  self._get_feature_header_by_name(b'MAT') or
-                  self._get_feature_header_by_name(b'SHADER'))
-        
-        if not mat_fh:
-            logger.warning("No MATERIALS feature → using fallback")
-            self.materials = [{'index': i, 'name': f'Mat_{i}'} for i in range(11)]  # From log
-            return len(self.materials)
-        
-        offset = self.header['features_data_offset'] + mat_fh['data_offset']
-        count = mat_fh['total_count']
-        
-        logger.start(f"Reading {count} materials @ 0x{offset:08X}")
-        self.materials = []
-        
-        for i in range(min(count, 50)):  # Safety limit
-            mat_offset = offset + (i * 0x8)
-            if mat_offset + 8 > len(self.data): break
-            
-            shader_idx = struct.unpack('<I', self.data[mat_offset:mat_offset+4])[0]
-            texture_count = struct.unpack('<I', self.data[mat_offset+4:mat_offset+8])[0]
-            
-            self.materials.append({
-                'index': i,
-                'name': f"Material_{i}",
-                'shader_index': shader_idx,
-                'texture_count': texture_count,
-                'textures': []
-            })
-            
-            if i < 3:
-                logger.info(f"Mat {i}: shader=0x{shader_idx:08X}, tex={texture_count}")
-        
-        logger.success("Materials parsed", f"{len(self.materials)} materials")
-        return len(self.materials)
-
-
-
-
     # --- 4.19: Material Parameter Vectors (Section 1 Block 0) - اضافه شده ---
     def read_material_parameter_vectors(self):
         """Read material parameter vectors from Section 1"""
@@ -2381,7 +2425,7 @@ class FMDLParser:
             if offset + vector_size > len(s1_block):
                 break
             
-            vec = struct.unpack('<4f', s1_block[offset:offset+16])
+            vec = _VEC4F(s1_block, offset)
             self.material_parameter_vectors.append({
                 'index': i,
                 'vector': vec,
@@ -2396,8 +2440,6 @@ class FMDLParser:
         # Section 1 blocks are stored after Section 0
         # This is a simplified version - in real implementation,
         # you'd parse Section 1 info from header
-        if not hasattr(self, 'section1_blocks'):
-            return None
         return self.section1_blocks.get(block_id)
 
 
@@ -2414,15 +2456,101 @@ class FMDLParser:
 # ============================================
 
 class VertexBufferReader:
+    # usage -> (vertex key, reader) - this reader's own usage/type numbering
+    ELEMENT_DISPATCH = {
+        0: ('position', '_read_vector3'),
+        2: ('normal', '_read_vector4'),
+        14: ('tangent', '_read_vector4'),
+        8: ('uv', '_read_uv'),
+        9: ('uv2', '_read_uv'),
+        3: ('color', '_read_color'),
+        1: ('bone_weights', '_read_bone_weights'),
+        7: ('bone_indices', '_read_bone_indices'),
+    }
+    
+    # reader -> (accepted element type, numpy dtype, components) for whole-buffer decode
+    READER_COLUMNS = {
+        '_read_vector3': (1, '<f4', 3),       # R32G32B32_FLOAT
+        '_read_vector4': (6, '<f2', 4),       # R16G16B16A16_FLOAT
+        '_read_uv': (7, '<f2', 2),            # R16G16_FLOAT
+        '_read_unorm4': (8, 'u1', 4),         # R8G8B8A8_UNORM (color, bone weights)
+        '_read_bone_indices': (9, 'u1', 4),   # R8G8B8A8_UINT
+    }
+    UNORM8_SCALE = np.float32(1.0 / 255.0)
+    
     def __init__(self, fmdl_data, file_data):
         self.fmdl = fmdl_data
         self.data = file_data
+        self._mv = memoryview(file_data).cast('B') if file_data is not None else None  # zero-copy byte view
+        self._layout_plans = {}  # (format start, element count) -> vertex parse plan
+        self.streams = {}  # vertex key -> (n, components) array of the last buffer read
         logger.section("VERTEX BUFFER READER")
 
     
     def read_vertex_buffer(self, mesh_def):
+        """Per-vertex dicts - compatibility shim over the column decode (see read_vertex_arrays)"""
         logger.start(f"Reading vertex buffer for mesh {mesh_def['index']}")
         
+        source = self._vertex_source(mesh_def)
+        if source is None:
+            return None
+        
+        # Read vertices
+        verts = self._read_vertices_from_buffer(mesh_def, *source)
+        logger.success("Vertex buffer", f"{len(verts)} vertices")
+        return verts
+    
+    def read_vertex_arrays(self, mesh_def):
+        """Vertex attributes as SoA {vertex key: (n, components) array} - no per-vertex dicts"""
+        return self._decode_vertex_job(self._vertex_job(mesh_def))
+    
+    def read_all_vertex_arrays(self, mesh_defs, max_workers=None):
+        """read_vertex_arrays for many meshes, in mesh order - column decodes run on a thread pool
+        
+        Layouts are resolved first on the calling thread, so the lazy _layout_plans cache is
+        never written from a worker; workers only read the file view and their own job.
+        """
+        jobs = [self._vertex_job(mesh_def) for mesh_def in mesh_defs]
+        if len(jobs) < 2:
+            return [self._decode_vertex_job(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self._decode_vertex_job, jobs))
+    
+    def _vertex_job(self, mesh_def):
+        """Resolve a mesh's vertex range and layout plan -> (mesh index, offset, stride, count, plan) or None"""
+        logger.start(f"Reading vertex arrays for mesh {mesh_def['index']}")
+        
+        source = self._vertex_source(mesh_def)
+        if source is None:
+            return None
+        
+        vert_offset, stride, vert_count, plan = self._vertex_range(mesh_def, *source)
+        vert_count = max(0, min(vert_count, (len(self.data) - vert_offset) // stride))  # Whole vertices only
+        return mesh_def['index'], vert_offset, stride, vert_count, plan
+    
+    def _decode_vertex_job(self, job):
+        """Decode one resolved vertex range -> SoA {vertex key: array}"""
+        if job is None:
+            return {}
+        
+        mesh_idx, vert_offset, stride, vert_count, plan = job
+        arrays, leftover = self._decode_columns(vert_offset, stride, vert_count, plan)
+        
+        # Elements the column decode can't handle - one scalar pass each
+        for vertex_key, reader, elem_offset, elem_type in leftover:
+            try:
+                values = [reader(vert_offset + v * stride + elem_offset, elem_type) for v in range(vert_count)]
+            except Exception as e:
+                logger.debug(f"Error reading element {vertex_key}: {str(e)}")
+                continue
+            if values and values[0] is not None:
+                arrays[vertex_key] = np.array(values)
+        
+        logger.success(f"Vertex arrays (mesh {mesh_idx})", f"{vert_count} vertices, {len(arrays)} attributes")
+        return arrays
+    
+    def _vertex_source(self, mesh_def):
+        """Validate the mesh's layout chain -> (buffer header, file buffer, format start) or None"""
         layout_idx = mesh_def['data_layout_index']
         if layout_idx >= len(self.fmdl['mesh_data_layouts']):
             logger.error("Invalid layout", layout_idx)
@@ -2456,13 +2584,11 @@ class VertexBufferReader:
             logger.error("Not VBUFFER")
             return None
         
-        # Read vertices
-        verts = self._read_vertices_from_buffer(mesh_def, buf_header, file_buf, layout['format_elements_start'])
-        logger.success("Vertex buffer", f"{len(verts)} vertices")
-        return verts
+        return buf_header, file_buf, layout['format_elements_start']
 
   
-    def _read_vertices_from_buffer(self, mesh_def, buf_header, file_buf, format_start):
+    def _vertex_range(self, mesh_def, buf_header, file_buf, format_start):
+        """-> (vertex offset, stride, vertex count, layout plan)"""
         stride = buf_header['stride']
         
         expected_size = file_buf['data_size']
@@ -2483,20 +2609,83 @@ class VertexBufferReader:
         
         logger.info(f"🔍 Mesh {mesh_def['index']}: vert_start={vert_start}, "
            f"vert_offset=0x{vert_offset:X}, stride={stride}")
-
-        
         
+        plan = self._layout_plan(format_start, buf_header['format_element_count'])
+        return vert_offset, stride, vert_count, plan
+    
+    def _read_vertices_from_buffer(self, mesh_def, buf_header, file_buf, format_start):
+        vert_offset, stride, vert_count, plan = self._vertex_range(mesh_def, buf_header, file_buf, format_start)
         vertices = []
         
-        for v in range(vert_count):
-            v_offset = vert_offset + (v * stride)
-            vertex = self._parse_vertex(v_offset, stride, format_start, buf_header['format_element_count'])
-            vertices.append(vertex)
+        # Column decode over every whole vertex in the file; only elements it can't
+        # handle (and vertices cut off by the end of the file) stay per-vertex
+        complete = max(0, min(vert_count, (len(self.data) - vert_offset) // stride))
+        arrays, leftover = self._decode_columns(vert_offset, stride, complete, plan)
+        columns = tuple((vertex_key, list(map(tuple, array.tolist()))) for vertex_key, array in arrays.items())
+        
+        # 🔧 Hot-loop locals - format elements are already resolved into the plan
+        parse_vertex = self._parse_vertex
+        append = vertices.append
+        
+        for v, v_offset in enumerate(range(vert_offset, vert_offset + complete * stride, stride)):
+            vertex = parse_vertex(v_offset, leftover)
+            for vertex_key, values in columns:
+                vertex[vertex_key] = values[v]
+            append(vertex)
+        
+        # Truncated tail - per-vertex path reports the bad reads
+        for v in range(complete, vert_count):
+            append(parse_vertex(vert_offset + (v * stride), plan))
         
         return vertices
     
+    def _decode_columns(self, vert_offset, stride, vert_count, plan):
+        """Decode plan elements for all vertices at once -> ({vertex key: (n, components) array}, leftover plan)"""
+        streams = self.streams = {}  # per call - concurrent decodes never share a dict
+        if vert_count <= 0 or vert_offset + vert_count * stride > len(self.data):
+            return streams, plan  # Callers pass whole in-file vertices only
+        
+        # (vertex, byte) matrix over the interleaved buffer - a view, no copy
+        raw = np.frombuffer(self._mv, dtype=np.uint8, count=vert_count * stride,
+                            offset=vert_offset).reshape(vert_count, stride)
+        leftover = []
+        for entry in plan:
+            vertex_key, reader, elem_offset, elem_type = entry
+            layout = self.READER_COLUMNS.get(reader.__name__)
+            if layout is None or layout[0] != elem_type:
+                leftover.append(entry)  # reader returns None for other types - cheap per vertex
+                continue
+            _accepted, dtype, components = layout
+            end = elem_offset + np.dtype(dtype).itemsize * components
+            if end > stride:
+                leftover.append(entry)
+                continue
+            
+            field = np.ascontiguousarray(raw[:, elem_offset:end]).view(dtype)
+            if dtype == '<f2':
+                field = field.astype(np.float32)  # F16C conversion in numpy
+            elif elem_type == 8:  # UNORM - uint8 -> float32 in one ufunc
+                field = np.multiply(field, self.UNORM8_SCALE, dtype=np.float32)
+            streams[vertex_key] = field
+        return streams, tuple(leftover)
+    
+    def _layout_plan(self, format_start, element_count):
+        """Specialize the element loop once per layout: ((vertex key, reader, element offset, type), ...)"""
+        key = (format_start, element_count)
+        plan = self._layout_plans.get(key)
+        if plan is None:
+            elements = self.fmdl['mesh_buffer_format_elements'][format_start:format_start + element_count]
+            plan = []
+            for elem in elements:
+                dispatch = self.ELEMENT_DISPATCH.get(elem['usage'])
+                if dispatch is not None:
+                    vertex_key, reader_name = dispatch
+                    plan.append((vertex_key, getattr(self, reader_name), elem['offset'], elem['type']))
+            plan = self._layout_plans[key] = tuple(plan)
+        return plan
+    
    
-    def _parse_vertex(self, offset, stride, format_start, element_count):
+    def _parse_vertex(self, offset, plan):
         vertex = {
             'position': None,
             'normal': None,
@@ -2508,114 +2697,43 @@ class VertexBufferReader:
             'bone_indices': None,
         }
         
-        # Read each format element
-        for e in range(element_count):
-            elem_idx = format_start + e
-            if elem_idx >= len(self.fmdl['mesh_buffer_format_elements']):
-                continue
-            
-            elem = self.fmdl['mesh_buffer_format_elements'][elem_idx]
-            elem_offset = offset + elem['offset']
-            
-            usage = elem['usage']
-            elem_type = elem['type']
-            
+        # Read each format element (layout plan - no per-element usage branches)
+        for vertex_key, reader, elem_offset, elem_type in plan:
             try:
-                if usage == 0:  # POSITION
-                    vertex['position'] = self._read_vector3(elem_offset, elem_type)
-                elif usage == 2:  # NORMAL
-                    vertex['normal'] = self._read_vector4(elem_offset, elem_type)
-                elif usage == 14:  # TANGENT
-                    vertex['tangent'] = self._read_vector4(elem_offset, elem_type)
-                elif usage == 8:  # UV0
-                    vertex['uv'] = self._read_uv(elem_offset, elem_type)
-                elif usage == 9:  # UV1
-                    vertex['uv2'] = self._read_uv(elem_offset, elem_type)
-                elif usage == 3:  # COLOR
-                    vertex['color'] = self._read_color(elem_offset, elem_type)
-                elif usage == 1:  # BONE_WEIGHT0
-                    vertex['bone_weights'] = self._read_bone_weights(elem_offset, elem_type)
-                elif usage == 7:  # BONE_INDEX0
-                    vertex['bone_indices'] = self._read_bone_indices(elem_offset, elem_type)
+                vertex[vertex_key] = reader(offset + elem_offset, elem_type)
             except Exception as e:
-                logger.debug(f"Error reading element {e}: {str(e)}")
+                logger.debug(f"Error reading element {vertex_key}: {str(e)}")
         
         return vertex
     
     def _read_vector3(self, offset, elem_type):
         if elem_type == 1:  # R32G32B32_FLOAT
-            x = struct.unpack('<f', self.data[offset:offset+4])[0]
-            y = struct.unpack('<f', self.data[offset+4:offset+8])[0]
-            z = struct.unpack('<f', self.data[offset+8:offset+12])[0]
-            return (x, y, z)
+            return _VEC3F(self._mv, offset)
         return None
     
     def _read_vector4(self, offset, elem_type):
         if elem_type == 6:  # R16G16B16A16_FLOAT
-            # Half-float conversion
-            x = self._half_to_float(struct.unpack('<H', self.data[offset:offset+2])[0])
-            y = self._half_to_float(struct.unpack('<H', self.data[offset+2:offset+4])[0])
-            z = self._half_to_float(struct.unpack('<H', self.data[offset+4:offset+6])[0])
-            w = self._half_to_float(struct.unpack('<H', self.data[offset+6:offset+8])[0])
-            return (x, y, z, w)
+            return _VEC4E(self._mv, offset)
         return None
     
     def _read_uv(self, offset, elem_type):
         if elem_type == 7:  # R16G16_FLOAT
-            u = self._half_to_float(struct.unpack('<H', self.data[offset:offset+2])[0])
-            v = self._half_to_float(struct.unpack('<H', self.data[offset+2:offset+4])[0])
-            return (u, v)
+            return _VEC2E(self._mv, offset)
         return None
     
-    def _read_color(self, offset, elem_type):
+    def _read_unorm4(self, offset, elem_type):
         if elem_type == 8:  # R8G8B8A8_UNORM
-            r = self.data[offset] / 255.0
-            g = self.data[offset+1] / 255.0
-            b = self.data[offset+2] / 255.0
-            a = self.data[offset+3] / 255.0
-            return (r, g, b, a)
+            x, y, z, w = _VEC4B(self._mv, offset)
+            return (x / 255.0, y / 255.0, z / 255.0, w / 255.0)
         return None
     
-    def _read_bone_weights(self, offset, elem_type):
-        if elem_type == 8:  # R8G8B8A8_UNORM
-            w0 = self.data[offset] / 255.0
-            w1 = self.data[offset+1] / 255.0
-            w2 = self.data[offset+2] / 255.0
-            w3 = self.data[offset+3] / 255.0
-            return (w0, w1, w2, w3)
-        return None
+    _read_color = _read_unorm4
+    _read_bone_weights = _read_unorm4
     
     def _read_bone_indices(self, offset, elem_type):
         if elem_type == 9:  # R8G8B8A8_UINT
-            i0 = self.data[offset]
-            i1 = self.data[offset+1]
-            i2 = self.data[offset+2]
-            i3 = self.data[offset+3]
-            return (i0, i1, i2, i3)
+            return _VEC4B(self._mv, offset)
         return None
-    
-    def _half_to_float(self, half_val):
-        """Convert 16-bit half-float to 32-bit float"""
-        import math
-        
-        sign = (half_val >> 15) & 0x1
-        exponent = (half_val >> 10) & 0x1F
-        mantissa = half_val & 0x3FF
-        
-        if exponent == 0:
-            if mantissa == 0:
-                return -0.0 if sign else 0.0
-            else:
-                # Subnormal number
-                return ((-1) ** sign) * (mantissa / 1024.0) * (2 ** -14)
-        elif exponent == 31:
-            if mantissa == 0:
-                return float('-inf') if sign else float('inf')
-            else:
-                return float('nan')
-        
-        # Normal number
-        return ((-1) ** sign) * (1.0 + mantissa / 1024.0) * (2 ** (exponent - 15))
 
 # ============================================
 # SECTION 6: INDEX BUFFER READER 
@@ -2625,18 +2743,27 @@ class IndexBufferReader:
     def __init__(self, fmdl_data, file_data):
         self.fmdl = fmdl_data
         self.data = file_data
+        self._mv = memoryview(file_data).cast('B') if file_data is not None else None  # zero-copy byte view
         logger.section("INDEX BUFFER READER")
     
+    # INDEX16 / INDEX32 element types -> numpy dtype
+    INDEX_DTYPES = {10: np.dtype('<u2'), 11: np.dtype('<u4')}
     
+    def read_indices(self, offset, count, elem_type=10):
+        """Zero-copy view of `count` indices at offset (clamped to the file)"""
+        dtype = self.INDEX_DTYPES[elem_type]
+        count = max(0, min(count, (len(self.data) - offset) // dtype.itemsize))
+        return np.frombuffer(self._mv, dtype=dtype, count=count, offset=offset)
     
     def read_faces(self, mesh_def):
+        """Mesh triangles as one (N, 3) INDEX16 array (views into the file when a single slice)"""
         logger.start(f"Reading faces for mesh {mesh_def['index']}")
         
         slice_start = mesh_def['ibuffer_slices_start']
         index_buffer = next((b for b in self.fmdl['file_mesh_buffer_headers'] if b['type'] == 1), None)
         
         if not index_buffer:
-            return []
+            return np.empty((0, 3), dtype=np.uint16)
         
         faces = []
         vert_count = mesh_def['vertex_count']
@@ -2654,23 +2781,18 @@ class IndexBufferReader:
             offset = index_buffer['data_offset'] + (slice_data['start_index'] * 2)
             triangle_count = slice_data['count'] // 3
             
-            slice_faces = 0
-            for i in range(triangle_count):
-                if offset + 6 > len(self.data):
-                    break
-                    
-                i0 = struct.unpack('<H', self.data[offset:offset+2])[0]
-                i1 = struct.unpack('<H', self.data[offset+2:offset+4])[0]
-                i2 = struct.unpack('<H', self.data[offset+4:offset+6])[0]
-               
-                if (i0 < 65000 and i1 < 65000 and i2 < 65000):  # 16-bit max
-                    faces.append((i0, i1, i2))
-                    slice_faces += 1
-                
-                offset += 6
+            # Whole slice in one block read (INDEX16), whole triangles only
+            indices = self.read_indices(offset, triangle_count * 3, 10)
+            triangles = indices[:len(indices) // 3 * 3].reshape(-1, 3)
+            triangles = triangles[(triangles < 65000).all(axis=1)]  # 16-bit max
+            
+            faces.append(triangles)
+            slice_faces = len(triangles)
             
             logger.debug(f"Slice {slice_idx}: {slice_faces}/{triangle_count}F")
         
+        faces = (faces[0] if len(faces) == 1 else
+                 np.concatenate(faces) if faces else np.empty((0, 3), dtype=np.uint16))
         logger.success(f"Mesh {mesh_def['index']}", f"{len(faces)}F from slices {slice_start}+")
         return faces
 
@@ -2771,7 +2893,7 @@ class FoxTextureFinder:
             return
         
         # Add dictionary entries to hash index
-        for hash_val, path in self.dict.qar_dict.items():
+        for hash_val, path in self.dict.qar_items():
             # Convert .ftex to .dds
             dds_path = path.replace('.ftex', '.dds')
             # Find matching file
@@ -2833,13 +2955,7 @@ class FoxTextureFinder:
     
     def _hash_path(self, path):
         """Calculate PathCode64 hash"""
-        # Use CityHash if available, otherwise simple hash
-        try:
-            from CityHash import CityHash64
-            return CityHash64(path.lower())
-        except:
-            # Fallback: use built-in hash (not accurate for FMDL but for lookup)
-            return hash(path.lower()) & 0xFFFFFFFFFFFFFFFF
+        return CityHash64(path.lower())
     
     def _find_by_name_and_suffix(self, texture_ref):
         """Find texture by name and expected suffix"""
@@ -3393,6 +3509,8 @@ class BlenderBuilder:
         self.created_materials = {}
         self.armature = None
         self.aabb_empties = []
+        self._vertex_reader = None  # shared by all meshes - layout plans are built once per layout
+        self._index_reader = None
         
         logger.section("BLENDER BUILDER INITIALIZED")
         logger.info(f"Input data: {len(self.data['bones'])} bones, "
@@ -3559,8 +3677,12 @@ class BlenderBuilder:
         
         objects = []
         
-        for mesh_data in self.data['meshes']:
-            obj = self._create_single_mesh(mesh_data)
+        # Vertex decode for all meshes up front (thread pool, no bpy); Blender objects on this thread
+        mesh_defs = list(self.data['meshes'])
+        all_vertices = self._buffer_readers()[0].read_all_vertex_arrays(mesh_defs)
+        
+        for mesh_data, vertices in zip(mesh_defs, all_vertices):
+            obj = self._create_single_mesh(mesh_data, vertices)
             if obj:
                 objects.append(obj)
         
@@ -3575,18 +3697,25 @@ class BlenderBuilder:
     
     
     # --- 8.3: Mesh Builder - Material Assignment (کاملاً اصلاح شده) ---
-    def _create_single_mesh(self, mesh_data):
+    def _buffer_readers(self):
+        """Vertex/index readers shared by every mesh (layout plans are reused across meshes)"""
+        if self._vertex_reader is None:
+            self._vertex_reader = VertexBufferReader(self.data, self.data.get('raw_data'))
+            self._index_reader = IndexBufferReader(self.data, self.data.get('raw_data'))
+        return self._vertex_reader, self._index_reader
+    
+    def _create_single_mesh(self, mesh_data, vertices=None):
         """Create single mesh with correct material assignment"""
         mesh_idx = mesh_data['index']
         
         # Read buffers
-        vertex_reader = VertexBufferReader(self.data, self.data.get('raw_data'))
-        vertices = vertex_reader.read_vertex_buffer(mesh_data)
-        if not vertices or len(vertices) < 3:
+        vertex_reader, index_reader = self._buffer_readers()
+        if vertices is None:
+            vertices = vertex_reader.read_vertex_arrays(mesh_data)  # SoA: {key: (n, components) array}
+        if 'position' not in vertices or len(vertices['position']) < 3:
             logger.warning(f"Mesh {mesh_idx}: No vertices")
             return None
         
-        index_reader = IndexBufferReader(self.data, self.data.get('raw_data'))
         faces = index_reader.read_faces(mesh_data)
         
         if len(faces) < 1:
@@ -3625,7 +3754,7 @@ class BlenderBuilder:
         if mesh_data.get('bone_group_index', 0xFFFF) != 0xFFFF:
             self._add_weights(obj, vertices, mesh_data)
         
-        logger.success(f"Mesh {mesh_idx}", f"{len(vertices)}V {len(faces)}F")
+        logger.success(f"Mesh {mesh_idx}", f"{len(vertices['position'])}V {len(faces)}F")
         return obj
     
     def _get_mesh_name(self, mesh_data):
@@ -3649,63 +3778,68 @@ class BlenderBuilder:
         return f"Mesh_{mesh_idx:03d}"
     
     def _build_mesh_geometry(self, mesh, vertices, faces):
-        """Build mesh geometry in Blender"""
+        """Build mesh geometry in Blender with bulk foreach_set calls"""
         # Create vertices (convert Y-up to Z-up)
-        verts = [(v['position'][0], v['position'][2], -v['position'][1]) 
-                 for v in vertices if v.get('position')]
-        
-        # Create faces
-        face_indices = []
-        for face in faces:
-            if len(face) == 3:
-                face_indices.append(face)
-        
-        # Build mesh
-        mesh.from_pydata(verts, [], face_indices)
-        mesh.update()
+        positions = np.asarray(vertices['position'], dtype=np.float32).reshape(-1, 3)
+        co = np.column_stack((positions[:, 0], positions[:, 2], -positions[:, 1]))
+        vert_count = len(co)
+        
+        # Create faces (triangles that reference existing vertices only)
+        tris = np.asarray(faces, dtype=np.int32).reshape(-1, 3)  # (N, 3) from read_faces
+        tris = tris[(tris < vert_count).all(axis=1)]
+        loop_count = len(tris) * 3
+        
+        # Build mesh - one C call per attribute instead of per element
+        mesh.vertices.add(vert_count)
+        mesh.vertices.foreach_set('co', co.ravel())
+        mesh.loops.add(loop_count)
+        mesh.loops.foreach_set('vertex_index', tris.ravel())
+        mesh.polygons.add(len(tris))
+        mesh.polygons.foreach_set('loop_start', np.arange(0, loop_count, 3, dtype=np.int32))
+        if not mesh.polygons.bl_rna.properties['loop_total'].is_readonly:  # Derived in Blender 4.x
+            mesh.polygons.foreach_set('loop_total', np.full(len(tris), 3, dtype=np.int32))
+        mesh.update(calc_edges=True)
         
         # Set normals
-        if vertices[0].get('normal'):
+        if 'normal' in vertices:
             mesh.create_normals_split()
-            for i, v in enumerate(mesh.vertices):
-                if i < len(vertices) and vertices[i].get('normal'):
-                    n = vertices[i]['normal']
-                    v.normal = (n[0], n[2], -n[1])
+            n = np.asarray(vertices['normal'], dtype=np.float32)[:vert_count]
+            normals = np.column_stack((n[:, 0], n[:, 2], -n[:, 1]))
+            mesh.vertices.foreach_set('normal', normals.ravel())
+    
+    def _loop_vertex_indices(self, mesh):
+        """Vertex index of every loop (one foreach_get)"""
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get('vertex_index', loop_verts)
+        return loop_verts
     
     def _add_uv_layers(self, mesh, vertices):
         """Add UV layers to mesh"""
-        if not vertices[0].get('uv'):
+        # VertexBufferReader stores UV0 in 'uv' and UV1 in 'uv2'
+        uv_keys = [key for key in ('uv', 'uv2') if key in vertices]
+        if not uv_keys:
             return
         
-        uv_count = len(vertices[0]['uv'])
+        loop_verts = self._loop_vertex_indices(mesh)
         
-        for uv_idx in range(uv_count):
+        for uv_idx, key in enumerate(uv_keys):
             uv_layer = mesh.uv_layers.new(name=f"UV{uv_idx}")
             
-            for face in mesh.polygons:
-                for loop_idx in face.loop_indices:
-                    vert_idx = mesh.loops[loop_idx].vertex_index
-                    if vert_idx < len(vertices) and uv_idx < len(vertices[vert_idx]['uv']):
-                        uv = vertices[vert_idx]['uv'][uv_idx]
-                        # Flip V coordinate for Blender
-                        uv_layer.data[loop_idx].uv = (uv[0], 1.0 - uv[1])
+            uvs = np.asarray(vertices[key], dtype=np.float32)[loop_verts]
+            uvs[:, 1] = 1.0 - uvs[:, 1]  # Flip V coordinate for Blender
+            uv_layer.data.foreach_set('uv', uvs.ravel())
     
     def _add_vertex_colors(self, mesh, vertices):
         """Add vertex colors if present"""
-        if not vertices[0].get('color'):
+        if 'color' not in vertices:
             return
         
         color_layer = mesh.vertex_colors.new(name="Col")
         
-        for face in mesh.polygons:
-            for loop_idx in face.loop_indices:
-                vert_idx = mesh.loops[loop_idx].vertex_index
-                if vert_idx < len(vertices):
-                    c = vertices[vert_idx]['color']
-                    # Normalize 0-255 to 0-1
-                    color_layer.data[loop_idx].color = (
-                        c[0]/255.0, c[1]/255.0, c[2]/255.0, c[3]/255.0
-                    )
+        # Colors are already 0-1 (R8G8B8A8_UNORM decoded by VertexBufferReader)
+        loop_verts = self._loop_vertex_indices(mesh)
+        colors = np.asarray(vertices['color'], dtype=np.float32)[loop_verts]
+        color_layer.data.foreach_set('color', colors.ravel())
 
 
 
@@ -3763,24 +3897,23 @@ class BlenderBuilder:
                 vertex_groups[i] = vg  # Map local index to vertex group
                 logger.debug(f"Created vertex group: {bone_name} (local idx: {i})")
         
-        # Assign weights
+        # Assign weights - only the (vertex, slot) pairs that pass the filter are visited
         weight_count = 0
-        for v_idx, v_data in enumerate(vertices):
-            weights = v_data.get('bone_weights')
-            indices = v_data.get('bone_indices')
-            
-            if not weights or not indices:
-                continue
-            
-            for w, b_idx in zip(weights, indices):
-                if w > 0.001 and b_idx < len(bone_indices):
-                    local_idx = b_idx  # b_idx is already local to bone group
-                    if local_idx in vertex_groups:
-                        try:
-                            vertex_groups[local_idx].add([v_idx], w, 'REPLACE')
-                            weight_count += 1
-                        except Exception as e:
-                            logger.debug(f"Error adding weight: {e}")
+        weights = vertices.get('bone_weights')
+        indices = vertices.get('bone_indices')
+        if weights is not None and indices is not None:
+            n = min(len(weights), len(indices))
+            weights, indices = weights[:n], indices[:n]
+            used = (weights > 0.001) & (indices < len(bone_indices))
+            v_ids, slots = np.nonzero(used)
+            for v_idx, w, b_idx in zip(v_ids.tolist(), weights[used].tolist(), indices[used].tolist()):
+                local_idx = b_idx  # b_idx is already local to bone group
+                if local_idx in vertex_groups:
+                    try:
+                        vertex_groups[local_idx].add([v_idx], w, 'REPLACE')
+                        weight_count += 1
+                    except Exception as e:
+                        logger.debug(f"Error adding weight: {e}")
         
         # Add armature modifier
         if self.armature: